@@ -1,15 +1,27 @@
 """reqcap CLI - minimal HTTP client for AI agents."""
 
+import collections
 import contextlib
+import functools
 import json
+import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
 import click
 
-HISTORY_FILE = Path.home() / ".reqcap_history.json"
+# None means ~/.reqcap_history.jsonl, resolved on first use rather than at import.
+HISTORY_FILE = None
 MAX_HISTORY = 50
+# Append-only history is rewritten down to MAX_HISTORY entries once it grows past this.
+HISTORY_COMPACT_BYTES = 256 * 1024
+# json.dumps builds a fresh encoder whenever it gets non-default options.
+_HISTORY_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Unicode \w is exactly str.isalnum() plus "_", matching the old per-char check.
+_SHELL_SAFE_RE = re.compile(r"[\w\-=./:@]+")
 
 TOOL_HELP = """\
 reqcap — Minimal HTTP client for AI agents.
@@ -186,6 +198,7 @@ CONFIG FILE FORMAT (.reqcap.yaml)
     env_file: .env                  # load .env file
     timeout: 30                     # seconds
     templates_dir: templates        # where to find template files
+    parallel_deps: false            # run independent depends: concurrently
     headers:
       Content-Type: application/json
     auth:
@@ -456,49 +469,15 @@ def main(
     do_init,
 ):
     """Execute HTTP requests with minimal, filtered output."""
-    from reqcap.core import (
-        build_auth_headers,
-        build_request_from_template,
-        diff_snapshot,
-        list_snapshots,
-        list_templates,
-        load_config,
-        load_env,
-        load_snapshot,
-        load_template,
-        parse_curl,
-        parse_form_fields,
-        resolve_config_path,
-        resolve_placeholders,
-        resolve_resource_dir,
-        resolve_value,
-        save_snapshot,
-        template_search_paths,
-    )
-    from reqcap.executor import execute_request
-    from reqcap.filters import evaluate_assert, extract_value, format_output
-
-    # --- Load config ---
-    config_path = resolve_config_path(config_file)
-    config = load_config(config_path)
-    defaults = config.get("defaults", {})
-
-    env_file = defaults.get("env_file")
-    env = load_env(env_file)
-
-    # Parse -v key=value pairs
-    variables = {}
-    for v_str in var:
-        if "=" in v_str:
-            k, val = v_str.split("=", 1)
-            variables[k.strip()] = val.strip()
+    # Imports are deferred to the branches that need them so metadata
+    # commands (--init, --history, ...) never load requests or the filters.
 
     # --- Validate mutually exclusive options ---
     if form_fields and body:
         click.echo("ERROR: --form and --body are mutually exclusive.", err=True)
         sys.exit(1)
 
-    # --- Dispatch ---
+    # --- Dispatch: commands independent of config ---
 
     if do_init:
         _cmd_init()
@@ -508,7 +487,18 @@ def main(
         _cmd_install_skill(install_skill_agent)
         return
 
+    # --- Load config ---
+    from reqcap.core import load_config, resolve_config_path
+
+    config_path = resolve_config_path(config_file)
+    config = load_config(config_path)
+    defaults = config.get("defaults", {})
+
+    # --- Dispatch: listing commands ---
+
     if show_list_snapshots:
+        from reqcap.core import list_snapshots
+
         _cmd_list_snapshots(
             config,
             snapshots_dir_override,
@@ -517,6 +507,8 @@ def main(
         return
 
     if show_list_templates:
+        from reqcap.core import list_templates
+
         _cmd_list_templates(
             list_templates_fn=list_templates,
             config=config,
@@ -528,6 +520,35 @@ def main(
         _cmd_history()
         return
 
+    # --- Request modes ---
+    from reqcap.core import (
+        build_auth_headers,
+        build_request_from_template,
+        diff_snapshot,
+        load_env,
+        load_snapshot,
+        load_template,
+        parse_curl,
+        parse_form_fields,
+        resolve_placeholders,
+        resolve_resource_dir,
+        resolve_value,
+        save_snapshot,
+        template_search_paths,
+    )
+    from reqcap.executor import execute_request
+    from reqcap.filters import evaluate_assert, extract_value, format_output
+
+    env_file = defaults.get("env_file")
+    env = load_env(env_file)
+
+    # Parse -v key=value pairs
+    variables = {}
+    for v_str in var:
+        if "=" in v_str:
+            k, val = v_str.split("=", 1)
+            variables[k.strip()] = val.strip()
+
     # Build snapshot/assert context for request modes
     snapshot_ctx = {
         "snapshot_name": snapshot_name,
@@ -684,38 +705,31 @@ def _cmd_list_templates(list_templates_fn, config, templates_dir_override=None):
         click.echo("Templates are user-created .yaml files, not built-in.")
         return
 
-    # Summary block — compact, LLM-scannable
-    click.echo(f"Templates from: {tdir}")
-    click.echo(f"{len(templates)} available:\n")
+    # Summary block — compact, LLM-scannable. Built up and echoed once.
+    lines = [f"Templates from: {tdir}", f"{len(templates)} available:", ""]
     for tpl in templates:
         name = tpl["name"]
         desc = tpl.get("description", "")
         method = tpl.get("method", "GET")
         url = tpl.get("url", "")
-        label = f"  {name} — {desc}" if desc else f"  {name}"
-        click.echo(label)
-        detail_parts = [f"{method} {url}"]
+        lines.append(f"  {name} — {desc}" if desc else f"  {name}")
         fields = tpl.get("fields", [])
-        if fields:
-            field_names = [f.get("name", "") for f in fields]
-            detail_parts.append(f"vars: {', '.join(field_names)}")
         exports = tpl.get("exports", {})
-        if exports:
-            detail_parts.append(f"exports: {', '.join(exports.keys())}")
         depends = tpl.get("depends", [])
-        if depends:
-            if isinstance(depends, str):
-                depends = [depends]
-            detail_parts.append(f"depends: {', '.join(depends)}")
         snap_cfg = tpl.get("snapshot", {})
-        if snap_cfg.get("enabled"):
-            snap_name = snap_cfg.get("name") or name
-            detail_parts.append(f"snapshot: {snap_name}")
-        click.echo(f"    {' | '.join(detail_parts)}")
+        detail_parts = (
+            f"{method} {url}",
+            fields and f"vars: {', '.join(f.get('name', '') for f in fields)}",
+            exports and f"exports: {', '.join(exports)}",
+            depends and f"depends: {', '.join(depends)}",
+            snap_cfg.get("enabled") and f"snapshot: {snap_cfg.get('name') or name}",
+        )
+        lines.append(f"    {' | '.join(p for p in detail_parts if p)}")
         body_fields = tpl.get("filter", {}).get("body_fields", [])
         if body_fields:
-            click.echo(f"    filter: {', '.join(body_fields)}")
-        click.echo()
+            lines.append(f"    filter: {', '.join(body_fields)}")
+        lines.append("")
+    click.echo("\n".join(lines))
 
 
 def _cmd_history():
@@ -723,14 +737,15 @@ def _cmd_history():
     if not hist:
         click.echo("No request history.")
         return
-    click.echo("Request history:\n")
+    lines = ["Request history:", ""]
     for i, entry in enumerate(hist):
         ts = entry.get("timestamp", "")
         m = entry.get("method", "?")
         u = entry.get("url", "?")
         tpl = entry.get("template")
         label = f"[{tpl}]" if tpl else u
-        click.echo(f"  [{i}] {m:<6} {label}  ({ts})")
+        lines.append(f"  [{i}] {m:<6} {label}  ({ts})")
+    click.echo("\n".join(lines))
 
 
 def _cmd_replay(
@@ -759,7 +774,7 @@ def _cmd_replay(
     if result.error:
         click.echo(f"ERROR: {result.error}", err=True)
         sys.exit(1)
-    fc = _build_filter_config(filter_fields, verbose, defaults)
+    fc = None if raw else _build_filter_config(filter_fields, verbose, defaults)
     click.echo(format_output(result, filter_config=fc, verbose=verbose, raw=raw))
     _handle_asserts(assert_ctx, result)
     _handle_snapshot_ops(snapshot_ctx, result)
@@ -801,7 +816,7 @@ def _cmd_import_curl(
     if result.error:
         click.echo(f"ERROR: {result.error}", err=True)
         sys.exit(1)
-    fc = _build_filter_config(filter_fields, verbose, defaults)
+    fc = None if raw else _build_filter_config(filter_fields, verbose, defaults)
     click.echo(format_output(result, filter_config=fc, verbose=verbose, raw=raw))
     _save_to_history(parsed["method"], parsed["url"], parsed.get("body"), headers)
     _handle_asserts(assert_ctx, result)
@@ -809,6 +824,63 @@ def _cmd_import_curl(
     _handle_snapshot_ops(snapshot_ctx, result)
 
 
+def _plan_deps(template, config, templates_dir_override):
+    """Return [(name, template)] for all dependencies, in execution order.
+
+    Walks the depends: graph depth-first with an explicit stack, loading
+    each template once and emitting it after its own dependencies
+    (post-order). A template shared by several dependents runs once.
+    Exits with an error on a cycle or a missing template.
+    """
+    from reqcap.core import load_template
+
+    def _depends_of(tpl):
+        return iter(tpl.get("depends", []))
+
+    root_name = template.get("name", "unknown")
+    loaded = {root_name: template}
+    order = []
+    done = set()
+    # Each stack frame is (name, iterator over its remaining depends);
+    # the names on the stack form the current chain for cycle reporting.
+    stack = [(root_name, _depends_of(template))]
+    on_stack = {root_name}
+
+    while stack:
+        name, pending = stack[-1]
+        dep_name = next(pending, None)
+        if dep_name is None:
+            stack.pop()
+            on_stack.discard(name)
+            done.add(name)
+            order.append(name)
+            continue
+
+        if dep_name in on_stack:
+            cycle_path = " → ".join([*(n for n, _ in stack), dep_name])
+            click.echo(
+                f"ERROR: Circular dependency detected: {cycle_path}",
+                err=True,
+            )
+            sys.exit(1)
+        if dep_name in done:
+            continue
+
+        dep_template = load_template(dep_name, config, templates_dir_override)
+        if dep_template is None:
+            click.echo(
+                f"ERROR: Dependency template '{dep_name}' not found.",
+                err=True,
+            )
+            sys.exit(1)
+        loaded[dep_name] = dep_template
+        stack.append((dep_name, _depends_of(dep_template)))
+        on_stack.add(dep_name)
+
+    # The root template itself is emitted last; the caller runs it.
+    return [(name, loaded[name]) for name in order[:-1]]
+
+
 def _resolve_and_execute_deps(
     template,
     config,
@@ -819,103 +891,121 @@ def _resolve_and_execute_deps(
     execute_request,
     extract_value,
     build_request_from_template,
-    visited=None,
-    chain=None,
-    cli_var_keys=None,
 ):
-    """Depth-first execute template dependencies, accumulating exports into variables.
+    """Execute template dependencies in order, accumulating exports into variables.
 
-    Returns updated variables dict.
-    Raises click.ClickException on cycle or load failure.
+    Returns updated variables dict. The caller's variables (CLI -v values)
+    sit in the top ChainMap layer, so dependency exports can never shadow
+    them.
+    Exits on cycle, load failure, or a failed dependency request.
     """
-    from reqcap.core import load_template
-
-    depends = template.get("depends", [])
-    if not depends:
+    plan = _plan_deps(template, config, templates_dir_override)
+    if not plan:
         return variables
 
-    if isinstance(depends, str):
-        depends = [depends]
+    cli_vars = variables
+    exported = {}
+    variables = collections.ChainMap(cli_vars, exported)
+    default_timeout = defaults.get("timeout")
 
-    if visited is None:
-        visited = set()
-    if chain is None:
-        chain = []
+    if defaults.get("parallel_deps"):
+        batches = _batch_deps(plan, defaults)
+    else:
+        batches = [[dep] for dep in plan]
 
-    template_name = template.get("name", "unknown")
-    visited.add(template_name)
-    chain.append(template_name)
+    for batch in batches:
+        reqs = [build_request_from_template(config, tpl, variables, env) for _, tpl in batch]
+        results = _execute_batch(execute_request, reqs, default_timeout)
 
-    variables = dict(variables)  # shallow copy to accumulate into
+        for (dep_name, _), req, result in zip(batch, reqs, results, strict=True):
+            if result.error:
+                click.echo(
+                    f"ERROR: Dependency '{dep_name}' failed: {result.error}",
+                    err=True,
+                )
+                sys.exit(1)
 
-    for dep_name in depends:
-        if dep_name in visited:
-            cycle_path = " → ".join([*chain, dep_name])
-            click.echo(
-                f"ERROR: Circular dependency detected: {cycle_path}",
-                err=True,
-            )
-            sys.exit(1)
+            # Print compact status line for dep
+            elapsed = int(result.elapsed_ms)
+            click.echo(f"[dep: {dep_name}] STATUS: {result.status_code} ({elapsed}ms)")
 
-        dep_template = load_template(dep_name, config, templates_dir_override)
-        if dep_template is None:
-            click.echo(
-                f"ERROR: Dependency template '{dep_name}' not found.",
-                err=True,
-            )
-            sys.exit(1)
+            # Extract exports from dep response into the lower layer;
+            # skip names the CLI already set, they would be shadowed anyway
+            exports = req.get("exports", {})
+            if exports and result.body:
+                for ename, epath in exports.items():
+                    if ename in cli_vars:
+                        continue
+                    value = extract_value(result.body, epath)
+                    if value is not None:
+                        exported[ename] = str(value)
 
-        # Recurse into this dep's own dependencies (depth-first)
-        variables = _resolve_and_execute_deps(
-            dep_template,
-            config,
-            variables,
-            env,
-            defaults,
-            templates_dir_override,
-            execute_request,
-            extract_value,
-            build_request_from_template,
-            visited=set(visited),
-            chain=list(chain),
-            cli_var_keys=cli_var_keys,
-        )
+    return dict(variables)
+
+
+def _batch_deps(plan, defaults):
+    """Group planned dependencies into batches that can run concurrently.
+
+    Walks the plan in order, starting a new batch whenever a dependency
+    needs something produced inside the current one — either one of its
+    own depends:, or a {{var}} exported by a batch member. Config defaults
+    are merged into every request, so their placeholders count for all.
+    """
+    from reqcap.core import placeholder_keys
+
+    shared_keys = placeholder_keys(defaults)
+    batches = []
+    batch_names = set()
+    batch_exports = set()
+    for name, tpl in plan:
+        needs = placeholder_keys(tpl) | shared_keys
+        needs.update(f["name"] for f in tpl.get("fields", []) if "name" in f)
+        if batches and not (
+            batch_names.intersection(tpl.get("depends", [])) or batch_exports & needs
+        ):
+            batches[-1].append((name, tpl))
+        else:
+            batches.append([(name, tpl)])
+            batch_names = set()
+            batch_exports = set()
+        batch_names.add(name)
+        batch_exports.update(tpl.get("exports", {}))
+    return batches
+
+
+def _execute_batch(execute_request, reqs, default_timeout):
+    """Execute built requests, concurrently when there is more than one.
+
+    Results come back in the same order as reqs, once every request in the
+    batch has finished.
+    """
 
-        # Build and execute the dependency request
-        req = build_request_from_template(config, dep_template, variables, env)
-        result = execute_request(
+    def run(req):
+        return execute_request(
             method=req["method"],
             url=req["url"],
             headers=req.get("headers"),
             body=req.get("body"),
-            timeout=_resolve_timeout(req.get("timeout"), defaults.get("timeout")),
+            timeout=_resolve_timeout(req.get("timeout"), default_timeout),
         )
 
-        if result.error:
-            click.echo(
-                f"ERROR: Dependency '{dep_name}' failed: {result.error}",
-                err=True,
-            )
-            sys.exit(1)
+    if len(reqs) == 1:
+        return [run(reqs[0])]
 
-        # Print compact status line for dep
-        elapsed = int(result.elapsed_ms)
-        click.echo(f"[dep: {dep_name}] STATUS: {result.status_code} ({elapsed}ms)")
+    from concurrent.futures import ThreadPoolExecutor
 
-        # Extract exports from dep response, merge into variables
-        # CLI -v variables take precedence over dep exports
-        exports = req.get("exports", {})
-        if exports and result.body:
-            for ename, epath in exports.items():
-                if cli_var_keys and ename in cli_var_keys:
-                    continue  # CLI -v takes precedence
-                value = extract_value(result.body, epath)
-                if value is not None:
-                    variables[ename] = str(value)
+    from reqcap.executor import use_thread_session
 
-    visited.discard(template_name)
-    chain.pop()
-    return variables
+    # Each worker gets its own session rather than sharing executor._SESSION
+    sessions = []
+    try:
+        with ThreadPoolExecutor(
+            max_workers=len(reqs), initializer=use_thread_session, initargs=(sessions,)
+        ) as pool:
+            return list(pool.map(run, reqs))
+    finally:
+        for session in sessions:
+            session.close()
 
 
 def _cmd_template(
@@ -952,7 +1042,6 @@ def _cmd_template(
         execute_request,
         extract_value,
         build_request_from_template,
-        cli_var_keys=set(variables.keys()),
     )
 
     req = build_request_from_template(config, template, variables, env)
@@ -973,7 +1062,7 @@ def _cmd_template(
         click.echo(f"ERROR: {result.error}", err=True)
         sys.exit(1)
 
-    fc = _build_filter_config(filter_fields, verbose, defaults, req.get("filter"))
+    fc = None if raw else _build_filter_config(filter_fields, verbose, defaults, req.get("filter"))
     click.echo(format_output(result, filter_config=fc, verbose=verbose, raw=raw))
     _save_to_history(
         req["method"],
@@ -1065,7 +1154,7 @@ def _cmd_direct(
         click.echo(f"ERROR: {result.error}", err=True)
         sys.exit(1)
 
-    fc = _build_filter_config(filter_fields, verbose, defaults)
+    fc = None if raw else _build_filter_config(filter_fields, verbose, defaults)
     click.echo(format_output(result, filter_config=fc, verbose=verbose, raw=raw))
     _save_to_history(method, url, body, headers)
     _handle_asserts(assert_ctx, result)
@@ -1080,9 +1169,11 @@ def _parse_headers(header_tuples):
     """Parse -H 'Name: Value' tuples into a dict."""
     headers = {}
     for h in header_tuples:
-        if ":" in h:
-            k, v = h.split(":", 1)
-            headers[k.strip()] = v.strip()
+        name, sep, value = h.partition(":")
+        name = name.strip()
+        # No colon or an empty name is not a header; requests rejects "" anyway
+        if sep and name:
+            headers[name] = value.strip()
     return headers
 
 
@@ -1258,25 +1349,30 @@ defaults:
 """
 
 
+@functools.lru_cache(maxsize=128)
 def _shell_quote(s):
     if not s:
         return "''"
-    if all(c.isalnum() or c in "-_=./:@" for c in s):
+    if _SHELL_SAFE_RE.fullmatch(s):
         return s
     return "'" + s.replace("'", "'\\''") + "'"
 
 
 def _load_history():
+    """Return up to MAX_HISTORY entries, newest first."""
     try:
-        if HISTORY_FILE.exists():
-            return json.loads(HISTORY_FILE.read_text())
+        with open(_history_file()) as f:
+            lines = collections.deque(f, maxlen=MAX_HISTORY)
     except Exception:
-        pass
-    return []
+        return []
+    entries = []
+    for line in reversed(lines):
+        with contextlib.suppress(ValueError):
+            entries.append(json.loads(line))
+    return entries
 
 
 def _save_to_history(method, url, body=None, headers=None, template=None):
-    hist = _load_history()
     entry = {"method": method, "url": url, "timestamp": datetime.now().isoformat()}
     if body:
         entry["body"] = body
@@ -1286,6 +1382,49 @@ def _save_to_history(method, url, body=None, headers=None, template=None):
             entry["headers"] = safe
     if template:
         entry["template"] = template
-    hist.insert(0, entry)
     with contextlib.suppress(Exception):
-        HISTORY_FILE.write_text(json.dumps(hist[:MAX_HISTORY], indent=2))
+        with open(_history_file(), "a") as f:
+            f.write(_HISTORY_ENCODER.encode(entry) + "\n")
+            size = f.tell()
+        if size > HISTORY_COMPACT_BYTES:
+            _compact_history()
+
+
+def _compact_history():
+    """Rewrite the history file keeping only the newest MAX_HISTORY lines.
+
+    Not locked: an entry another reqcap process appends between the read and
+    the replace is lost. History is best-effort, so that is accepted rather
+    than taking a lock on every save. The temp name is per process so two
+    concurrent compactions never write the same file.
+    """
+    path = _history_file()
+    with open(path) as f:
+        lines = collections.deque(f, maxlen=MAX_HISTORY)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text("".join(lines))
+    tmp.replace(path)
+
+
+def _history_file():
+    path = HISTORY_FILE or Path.home() / ".reqcap_history.jsonl"
+    if not path.exists():
+        with contextlib.suppress(Exception):
+            _import_legacy_history(path)
+    return path
+
+
+def _import_legacy_history(path):
+    """Convert the pre-JSONL history (a newest-first JSON list) into path.
+
+    The legacy file is renamed to .json.migrated afterwards, so deleting
+    path to clear history doesn't bring the old entries back.
+    """
+    legacy = path.with_suffix(".json")
+    if not legacy.exists():
+        return
+    entries = json.loads(legacy.read_text())
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text("".join(_HISTORY_ENCODER.encode(e) + "\n" for e in reversed(entries)))
+    tmp.replace(path)
+    legacy.replace(legacy.with_suffix(".json.migrated"))
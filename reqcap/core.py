@@ -2,6 +2,7 @@
 
 import base64
 import datetime
+import functools
 import json
 import os
 import re
@@ -11,9 +12,6 @@ import uuid
 from pathlib import Path
 from typing import Any
 
-import yaml
-from dotenv import dotenv_values
-
 GLOBAL_DIR = Path.home() / ".reqcap"
 GLOBAL_CONFIG = GLOBAL_DIR / "config.yaml"
 GLOBAL_TEMPLATES_DIR = GLOBAL_DIR / "templates"
@@ -26,6 +24,24 @@ CWD_CONFIG_CANDIDATES = [
     "reqcap.yml",
 ]
 
+_PLACEHOLDER_RE = re.compile(r"\{\{(.+?)\}\}")
+_VAR_RE = re.compile(r"\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)")
+_PATH_TOKEN_RE = re.compile(r"^([^\[]*)\[(\d+)\]$")
+
+
+def _yaml_load(stream) -> Any:
+    # Imported on first parse so runs that never read YAML skip it.
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml when built with it
+    return yaml.load(stream, Loader=loader)
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file with the fastest available safe loader."""
+    with open(path, "rb") as f:
+        return _yaml_load(f)
+
 
 def resolve_path(
     candidates: list[Path],
@@ -52,7 +68,25 @@ def resolve_config_path(config_file: str | None) -> Path | None:
     """
     if config_file:
         return resolve_path([Path(config_file)])
-    return resolve_path([Path(c) for c in CWD_CONFIG_CANDIDATES] + [GLOBAL_CONFIG])
+    present = _cwd_files(CWD_CONFIG_CANDIDATES)
+    for name in CWD_CONFIG_CANDIDATES:
+        if name in present:
+            return Path(name).resolve()
+    return resolve_path([GLOBAL_CONFIG])
+
+
+def _cwd_files(names: list[str]) -> set[str]:
+    """Return which of names are files in CWD, from a single directory read.
+
+    Only matching entries are stat'ed (and only when the directory entry
+    type alone can't tell, e.g. for symlinks).
+    """
+    wanted = set(names)
+    try:
+        with os.scandir() as it:
+            return {e.name for e in it if e.name in wanted and e.is_file()}
+    except OSError:
+        return set()
 
 
 def load_config(config_path: str | Path | None) -> dict:
@@ -66,8 +100,7 @@ def load_config(config_path: str | Path | None) -> dict:
     path = Path(config_path)
     if not path.exists():
         return {"defaults": {}, "_config_dir": None}
-    with open(path) as f:
-        data = yaml.safe_load(f) or {}
+    data = _load_yaml(path) or {}
     return {
         "defaults": data.get("defaults") or {},
         "_config_dir": path.resolve().parent,
@@ -78,12 +111,15 @@ def load_env(env_file: str | None, base_dir: str = ".") -> dict[str, str]:
     """Load .env file and merge with os.environ.
 
     Returns combined dict with .env values taking precedence over os.environ
-    for explicit vars, but os.environ available as fallback.
+    for explicit vars. The result is a full snapshot of os.environ, so
+    resolvers look variables up in it alone, with no os.environ fallback.
     """
     env = dict(os.environ)
     if env_file:
         dotenv_path = Path(base_dir) / env_file
         if dotenv_path.exists():
+            from dotenv import dotenv_values
+
             dotenv_vars = dotenv_values(str(dotenv_path))
             env.update({k: v for k, v in dotenv_vars.items() if v is not None})
     return env
@@ -92,19 +128,19 @@ def load_env(env_file: str | None, base_dir: str = ".") -> dict[str, str]:
 def resolve_value(value: str | None, env: dict[str, str]) -> str | None:
     """Resolve $VAR and ${VAR} references in a string value.
 
-    $VAR or ${VAR} -> look up in env dict, then os.environ.
+    $VAR or ${VAR} -> look up in env dict (as built by load_env).
     Returns the resolved value or original if no match.
     """
     if value is None:
         return None
-    if not isinstance(value, str):
+    if not isinstance(value, str) or "$" not in value:
         return value
 
     def _replace(m: re.Match) -> str:
         var_name = m.group(1) or m.group(2)
-        return env.get(var_name, os.environ.get(var_name, m.group(0)))
+        return env.get(var_name, m.group(0))
 
-    return re.sub(r"\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)", _replace, value)
+    return _VAR_RE.sub(_replace, value)
 
 
 def resolve_placeholders(
@@ -122,34 +158,70 @@ def resolve_placeholders(
     - {{date}} -> ISO date string
     - {{VAR}} -> look up in extra_vars dict (template variables)
     """
-    if not isinstance(text, str):
+    if not isinstance(text, str) or "{{" not in text:
         return text
 
-    def _replace(m: re.Match) -> str:
-        key = m.group(1).strip()
+    parts = _compile_placeholders(text)
+    if len(parts) == 1:  # braces but no complete placeholder
+        return text
+
+    out: list[str] = []
+    for literal, placeholder, key in parts:
+        out.append(literal)
+        if placeholder:
+            out.append(_resolve_placeholder(key, placeholder, env, extra_vars))
+    return "".join(out)
 
-        # env.VAR
-        if key.startswith("env."):
-            var = key[4:]
-            return env.get(var, os.environ.get(var, m.group(0)))
 
-        # built-in generators
-        if key in ("uuid", "uuidv4"):
-            return str(uuid.uuid4())
-        if key == "timestamp":
-            return str(int(_time.time()))
-        if key == "timestamp_ms":
-            return str(int(_time.time() * 1000))
-        if key == "date":
-            return datetime.datetime.now(datetime.timezone.utc).isoformat()
+@functools.lru_cache(maxsize=256)
+def _compile_placeholders(text: str) -> tuple[tuple[str, str, str], ...]:
+    """Split text into (literal, placeholder, key) parts.
+
+    Each literal is followed by the raw placeholder text and its stripped
+    key; the final part carries the trailing literal with empty placeholder
+    and key. Template strings repeat across calls, so the split is cached.
+    """
+    parts: list[tuple[str, str, str]] = []
+    pos = 0
+    for m in _PLACEHOLDER_RE.finditer(text):
+        parts.append((text[pos : m.start()], m.group(0), m.group(1).strip()))
+        pos = m.end()
+    parts.append((text[pos:], "", ""))
+    return tuple(parts)
+
+
+# Built-in {{...}} generators, evaluated fresh for every occurrence
+_BUILTIN_PLACEHOLDERS = {
+    "uuid": lambda: str(uuid.uuid4()),
+    "uuidv4": lambda: str(uuid.uuid4()),
+    "timestamp": lambda: str(int(_time.time())),
+    "timestamp_ms": lambda: str(int(_time.time() * 1000)),
+    "date": lambda: datetime.datetime.now(datetime.timezone.utc).isoformat(),
+}
+
+
+def _resolve_placeholder(
+    key: str,
+    placeholder: str,
+    env: dict[str, str],
+    extra_vars: dict[str, str] | None,
+) -> str:
+    """Resolve a single placeholder key, or return it unchanged."""
+    # env.VAR
+    if key.startswith("env."):
+        var = key[4:]
+        return env.get(var, placeholder)
 
-        # extra_vars lookup (template chaining)
-        if extra_vars and key in extra_vars:
-            return str(extra_vars[key])
+    # built-in generators
+    generate = _BUILTIN_PLACEHOLDERS.get(key)
+    if generate is not None:
+        return generate()
 
-        return m.group(0)
+    # extra_vars lookup (template chaining)
+    if extra_vars and key in extra_vars:
+        return str(extra_vars[key])
 
-    return re.sub(r"\{\{(.+?)\}\}", _replace, text)
+    return placeholder
 
 
 def resolve_in_obj(
@@ -157,36 +229,97 @@ def resolve_in_obj(
     env: dict[str, str],
     extra_vars: dict[str, str] | None = None,
 ) -> Any:
-    """Recursively resolve placeholders in dicts, lists, and strings."""
-    if isinstance(obj, str):
-        resolved = resolve_value(obj, env)
-        if isinstance(resolved, str):
-            resolved = resolve_placeholders(resolved, env, extra_vars)
-        return resolved
-    if isinstance(obj, dict):
+    """Recursively resolve placeholders in dicts, lists, and strings (exact builtin types)."""
+    t = type(obj)
+    if t is str:
+        return _resolve_str(obj, env, extra_vars)
+    if t is dict:
         return {k: resolve_in_obj(v, env, extra_vars) for k, v in obj.items()}
-    if isinstance(obj, list):
+    if t is list:
         return [resolve_in_obj(item, env, extra_vars) for item in obj]
     return obj
 
 
-def set_at_path(obj: dict, path: str, value: Any) -> None:
-    """Set a value at a dot-notation path in a nested dict.
+def _resolve_str(text: str, env: dict[str, str], extra_vars: dict[str, str] | None) -> Any:
+    resolved = resolve_value(text, env)
+    if isinstance(resolved, str):
+        resolved = resolve_placeholders(resolved, env, extra_vars)
+    return resolved
 
-    Supports: "data.message", "messages[0].content", "nested.array[1].field"
+
+def _resolve_in_place(
+    obj: Any,
+    env: dict[str, str],
+    extra_vars: dict[str, str] | None = None,
+) -> Any:
+    """Like resolve_in_obj, but rewrites strings inside obj's own containers.
+
+    Only for trees the caller owns (e.g. a fresh clone). Walks with an
+    explicit stack and writes back only strings that actually changed.
+    Returns the resolved root, which is a new value only when obj is a str.
+    """
+    if isinstance(obj, str):
+        return _resolve_str(obj, env, extra_vars)
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        items = container.items() if type(container) is dict else enumerate(container)
+        for k, v in items:
+            t = type(v)
+            if t is str:
+                resolved = _resolve_str(v, env, extra_vars)
+                if resolved is not v:
+                    container[k] = resolved
+            elif t is dict or t is list:
+                stack.append(v)
+    return obj
+
+
+def placeholder_keys(obj: Any) -> set[str]:
+    """Collect the {{...}} keys referenced by strings anywhere in obj."""
+    keys: set[str] = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            keys.update(key for _, _, key in _compile_placeholders(item) if key)
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return keys
+
+
+@functools.lru_cache(maxsize=256)
+def _path_tokens(path: str) -> tuple[str | int, ...]:
+    """Split a set_at_path path into key and index tokens.
+
+    Field paths are static per template, so the split is cached.
     """
-    # Tokenize: split on dots, then handle array indices
     tokens: list[str | int] = []
     for part in path.split("."):
         # Check for array indices like "messages[0]"
-        m = re.match(r"^([^\[]*)\[(\d+)\]$", part)
+        m = _PATH_TOKEN_RE.match(part)
         if m:
             if m.group(1):
                 tokens.append(m.group(1))
             tokens.append(int(m.group(2)))
         else:
             tokens.append(part)
+    return tuple(tokens)
+
+
+def set_at_path(obj: dict, path: str, value: Any) -> None:
+    """Set a value at a dot-notation path in a nested dict.
+
+    Supports: "data.message", "messages[0].content", "nested.array[1].field"
+    """
+    # Most field paths are a single top-level key
+    if "." not in path and "[" not in path:
+        obj[path] = value
+        return
 
+    tokens = _path_tokens(path)
     current: Any = obj
     for i, token in enumerate(tokens[:-1]):
         next_token = tokens[i + 1]
@@ -381,14 +514,25 @@ def list_templates(
         return (tdir, [])
 
     templates: list[dict] = []
-    for f in sorted(tdir.iterdir()):
-        if f.suffix in (".yaml", ".yml") and f.is_file():
-            tmpl = _read_template_file(f)
-            if tmpl:
-                templates.append(tmpl)
+    for entry in _scan_files(tdir, (".yaml", ".yml")):
+        tmpl = _read_template_file(Path(entry.path))
+        if tmpl:
+            templates.append(tmpl)
     return (tdir, templates)
 
 
+def _scan_files(directory: Path, suffixes: tuple[str, ...]) -> list[os.DirEntry]:
+    """Return files in directory with one of suffixes, sorted by name.
+
+    DirEntry carries the file type from the directory read itself, so no
+    per-entry stat is needed except for symlinks.
+    """
+    with os.scandir(directory) as it:
+        entries = [e for e in it if os.path.splitext(e.name)[1] in suffixes and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
 def _find_in_dir(directory: Path, name: str) -> dict | None:
     """Look for name.yaml or name.yml in a directory."""
     if not directory.is_dir():
@@ -403,18 +547,89 @@ def _find_in_dir(directory: Path, name: str) -> dict | None:
 def _read_template_file(path: Path) -> dict | None:
     """Read and validate a single template YAML file."""
     try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(path)
         if not isinstance(data, dict):
             return None
         # Default the name to the filename stem if not set
         if "name" not in data:
             data["name"] = path.stem
-        return data
+        return _normalize_template(data)
     except Exception:
         return None
 
 
+def _normalize_template(data: dict) -> dict:
+    """Coerce optional template keys to canonical shapes, in place.
+
+    After this every consumer can rely on:
+      depends  - list[str] (a bare string becomes a one-item list)
+      fields   - list[dict] (a bare string becomes {"name": ...})
+      exports  - dict
+      snapshot - dict (a bare bool becomes {"enabled": ...})
+      filter   - dict, or absent
+    """
+    depends = data.get("depends")
+    if isinstance(depends, str):
+        data["depends"] = [depends]
+    else:
+        data["depends"] = list(depends or [])
+
+    fields = []
+    for field in data.get("fields") or []:
+        if isinstance(field, str):
+            field = {"name": field}
+        if isinstance(field, dict):
+            fields.append(field)
+    data["fields"] = fields
+
+    data["exports"] = data.get("exports") or {}
+
+    snapshot = data.get("snapshot")
+    if isinstance(snapshot, bool):
+        data["snapshot"] = {"enabled": snapshot}
+    else:
+        data["snapshot"] = snapshot or {}
+
+    if data.get("filter") is None:
+        data.pop("filter", None)
+    return data
+
+
+def _curl_method(result: dict, value: str) -> None:
+    result["method"] = value.upper()
+
+
+def _curl_header(result: dict, value: str) -> None:
+    colon = value.find(":")
+    if colon != -1:
+        result["headers"][value[:colon].strip()] = value[colon + 1 :].strip()
+
+
+def _curl_data(result: dict, value: str) -> None:
+    result["body"] = value
+    if result["method"] == "GET":
+        result["method"] = "POST"
+
+
+def _curl_json(result: dict, value: str) -> None:
+    _curl_data(result, value)
+    result["headers"].setdefault("Content-Type", "application/json")
+    result["headers"].setdefault("Accept", "application/json")
+
+
+# Value-taking curl flags -> handler(result, value)
+_CURL_FLAG_HANDLERS = {
+    "-X": _curl_method,
+    "--request": _curl_method,
+    "-H": _curl_header,
+    "--header": _curl_header,
+    "-d": _curl_data,
+    "--data": _curl_data,
+    "--data-raw": _curl_data,
+    "--json": _curl_json,
+}
+
+
 def parse_curl(curl_command: str) -> dict:
     """Parse a curl command string into components.
 
@@ -446,28 +661,9 @@ def parse_curl(curl_command: str) -> dict:
     while i < len(tokens):
         tok = tokens[i]
 
-        if tok in ("-X", "--request") and i + 1 < len(tokens):
-            result["method"] = tokens[i + 1].upper()
-            i += 2
-        elif tok in ("-H", "--header") and i + 1 < len(tokens):
-            header = tokens[i + 1]
-            colon = header.find(":")
-            if colon != -1:
-                key = header[:colon].strip()
-                val = header[colon + 1 :].strip()
-                result["headers"][key] = val
-            i += 2
-        elif tok in ("-d", "--data", "--data-raw") and i + 1 < len(tokens):
-            result["body"] = tokens[i + 1]
-            if result["method"] == "GET":
-                result["method"] = "POST"
-            i += 2
-        elif tok == "--json" and i + 1 < len(tokens):
-            result["body"] = tokens[i + 1]
-            result["headers"].setdefault("Content-Type", "application/json")
-            result["headers"].setdefault("Accept", "application/json")
-            if result["method"] == "GET":
-                result["method"] = "POST"
+        handler = _CURL_FLAG_HANDLERS.get(tok)
+        if handler and i + 1 < len(tokens):
+            handler(result, tokens[i + 1])
             i += 2
         elif tok.startswith("-"):
             # Skip unknown flags; consume next token if it looks like a value
@@ -515,39 +711,45 @@ def build_request_from_template(
 
     url = base_url + path
 
-    # Headers: defaults + template + auth
-    headers = dict(defaults.get("headers") or {})
-    headers.update(template.get("headers") or {})
-
-    # Auth: template auth overrides default auth
-    auth_config = template.get("auth") or defaults.get("auth")
-    auth_headers = build_auth_headers(auth_config, env)
-    # Resolve placeholders in auth headers (e.g. {{token}})
-    auth_headers = {k: resolve_placeholders(v, env, variables) for k, v in auth_headers.items()}
-    headers.update(auth_headers)
-
-    # Resolve header values
+    # Headers: defaults + template, then auth on top
+    # resolve_value and resolve_placeholders return plain values untouched,
+    # so literal headers cost two substring checks each.
+    merged = (defaults.get("headers") or {}) | (template.get("headers") or {})
     headers = {
         k: resolve_placeholders(resolve_value(v, env) or v, env, variables)
-        for k, v in headers.items()
+        for k, v in merged.items()
     }
 
+    # Auth: template auth overrides default auth. build_auth_headers has
+    # already resolved $VARs, so only {{...}} placeholders remain (e.g.
+    # {{token}}); resolve them once rather than again with the headers.
+    auth_config = template.get("auth") or defaults.get("auth")
+    for k, v in build_auth_headers(auth_config, env).items():
+        headers[k] = resolve_placeholders(v, env, variables)
+
     # Body: apply field values, then resolve
     body = None
     if template.get("body") is not None:
-        import copy
+        body_obj = template["body"]
 
-        body_obj = copy.deepcopy(template["body"])
-
-        # Apply fields from variables
+        # Apply fields from variables. set_at_path mutates, so clone first —
+        # the body must be JSON-serializable, and a JSON round-trip through
+        # the C codec is cheaper than deepcopy.
+        field_values = []
         for field in template.get("fields", []):
             field_name = field.get("name", "")
-            field_path = field.get("path", field_name)
             if field_name in variables:
-                set_at_path(body_obj, field_path, variables[field_name])
-
-        # Resolve placeholders in body
-        body_obj = resolve_in_obj(body_obj, env, variables)
+                field_values.append((field.get("path", field_name), variables[field_name]))
+        if field_values:
+            body_obj = json.loads(json.dumps(body_obj))
+            for field_path, value in field_values:
+                set_at_path(body_obj, field_path, value)
+            # The clone is ours, so resolve placeholders in place
+            body_obj = _resolve_in_place(body_obj, env, variables)
+        else:
+            # resolve_in_obj rebuilds every dict and list, so the
+            # template's own body is never shared with the request
+            body_obj = resolve_in_obj(body_obj, env, variables)
         body = json.dumps(body_obj)
 
     # Filter: template overrides default
@@ -578,6 +780,10 @@ def build_request_from_template(
 # ── Snapshots ────────────────────────────────────────────────────────────
 
 
+_SNAPSHOT_HEAD_BYTES = 256
+_SNAPSHOT_SAVED_AT_RE = re.compile(rb'\{\s*"saved_at":\s*"([^"\\]*)"')
+
+
 def save_snapshot(name: str, result, snapshots_dir: Path) -> Path:
     """Save a response snapshot as JSON.
 
@@ -585,15 +791,17 @@ def save_snapshot(name: str, result, snapshots_dir: Path) -> Path:
     Creates the directory if it doesn't exist.
     """
     snapshots_dir.mkdir(parents=True, exist_ok=True)
+    # saved_at goes first so list_snapshots can read it from the file head.
     data = {
+        "saved_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
         "status_code": result.status_code,
         "headers": dict(result.headers) if result.headers else {},
         "body": result.body,
-        "saved_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
     }
     path = snapshots_dir / f"{name}.json"
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    # One-shot encode and a single write; json.dump would issue a write
+    # per encoder chunk.
+    path.write_text(json.dumps(data, indent=2))
     return path
 
 
@@ -606,13 +814,9 @@ def load_snapshot(
     sdir = resolve_resource_dir("snapshots", snapshots_dir_override, config)
     if not sdir:
         return None
-    path = sdir / f"{name}.json"
-    if not path.exists():
-        return None
     try:
-        with open(path) as f:
-            return json.load(f)
-    except Exception:
+        return json.loads((sdir / f"{name}.json").read_bytes())
+    except Exception:  # missing or unreadable
         return None
 
 
@@ -623,13 +827,18 @@ def diff_snapshot(snapshot: dict, result) -> list[str]:
     """
     diffs: list[str] = []
 
-    # Status code
+    # Fast path: unchanged responses (the common CI case) compare equal in
+    # a single C-level pass, skipping the recursive walk and its allocations.
     snap_status = snapshot.get("status_code")
+    snap_body = snapshot.get("body")
+    if snap_status == result.status_code and snap_body == result.body:
+        return diffs
+
+    # Status code
     if snap_status != result.status_code:
         diffs.append(f"status_code: {snap_status} → {result.status_code}")
 
     # Body
-    snap_body = snapshot.get("body")
     curr_body = result.body
 
     if isinstance(snap_body, dict) and isinstance(curr_body, dict):
@@ -642,17 +851,20 @@ def diff_snapshot(snapshot: dict, result) -> list[str]:
 
 def _diff_dicts(prefix: str, old: dict, new: dict, diffs: list[str]) -> None:
     """Recursively diff two dicts, appending human-readable lines."""
-    all_keys = sorted(set(list(old.keys()) + list(new.keys())))
-    for key in all_keys:
-        path = f"{prefix}.{key}"
+    for key in sorted(old.keys() | new.keys()):
         if key not in old:
-            diffs.append(f"{path}: (absent) → {_summarize(new[key])}")
-        elif key not in new:
-            diffs.append(f"{path}: {_summarize(old[key])} → (absent)")
-        elif isinstance(old[key], dict) and isinstance(new[key], dict):
-            _diff_dicts(path, old[key], new[key], diffs)
-        elif old[key] != new[key]:
-            diffs.append(f"{path}: {_summarize(old[key])} → {_summarize(new[key])}")
+            diffs.append(f"{prefix}.{key}: (absent) → {_summarize(new[key])}")
+            continue
+        if key not in new:
+            diffs.append(f"{prefix}.{key}: {_summarize(old[key])} → (absent)")
+            continue
+        old_val, new_val = old[key], new[key]
+        if old_val == new_val:  # also prunes equal subtrees without walking them
+            continue
+        if isinstance(old_val, dict) and isinstance(new_val, dict):
+            _diff_dicts(f"{prefix}.{key}", old_val, new_val, diffs)
+        else:
+            diffs.append(f"{prefix}.{key}: {_summarize(old_val)} → {_summarize(new_val)}")
 
 
 def _summarize(value) -> str:
@@ -676,19 +888,19 @@ def list_snapshots(
         return (sdir, [])
 
     snapshots: list[dict] = []
-    for f in sorted(sdir.iterdir()):
-        if f.suffix == ".json" and f.is_file():
-            try:
-                with open(f) as fh:
-                    data = json.load(fh)
-                snapshots.append(
-                    {
-                        "name": f.stem,
-                        "saved_at": data.get("saved_at", ""),
-                    },
-                )
-            except Exception:
-                snapshots.append({"name": f.stem, "saved_at": "?"})
+    for entry in _scan_files(sdir, (".json",)):
+        name = entry.name[: -len(".json")]
+        try:
+            with open(entry.path, "rb") as fh:
+                head = fh.read(_SNAPSHOT_HEAD_BYTES)
+                m = _SNAPSHOT_SAVED_AT_RE.match(head)
+                if m:
+                    saved_at = m.group(1).decode()
+                else:  # older layout: saved_at after the body
+                    saved_at = json.loads(head + fh.read()).get("saved_at", "")
+            snapshots.append({"name": name, "saved_at": saved_at})
+        except Exception:
+            snapshots.append({"name": name, "saved_at": "?"})
     return (sdir, snapshots)
 
 
@@ -703,17 +915,17 @@ def parse_form_fields(form_specs: tuple[str, ...] | list[str]) -> dict:
       - file fields: {key: (filename, file_handle, mime_type)}
     Text and file fields are separated into 'data' and 'files' keys.
     """
-    import mimetypes
-
     data: dict[str, str] = {}
     files: dict[str, tuple[str, Any, str]] = {}
 
     for spec in form_specs:
-        if "=" not in spec:
+        key, sep, value = spec.partition("=")
+        if not sep:
             continue
-        key, value = spec.split("=", 1)
         key = key.strip()
         if value.startswith("@"):
+            import mimetypes
+
             filepath = Path(value[1:])
             mime = mimetypes.guess_type(str(filepath))[0] or "application/octet-stream"
             files[key] = (filepath.name, open(filepath, "rb"), mime)  # noqa: SIM115
@@ -1,10 +1,50 @@
 """reqcap executor - HTTP request execution."""
 
 import json
+import threading
 import time
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+
+def _make_session() -> requests.Session:
+    """Build a session for execute_request: _SESSION, or a worker thread's own.
+
+    Reusing one session keeps connections alive between requests to the
+    same host (template dependencies, chained runs). Cookies are blocked so
+    requests stay independent, as they were with requests.request().
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+_SESSION = _make_session()
+# Sessions owned by worker threads; see use_thread_session.
+_THREAD = threading.local()
+
+
+def use_thread_session(opened: list[requests.Session]) -> None:
+    """Give the calling thread its own session for execute_request.
+
+    requests.Session is not documented as thread-safe, so threads that run
+    requests concurrently (parallel dependencies) each install one, e.g. as
+    a ThreadPoolExecutor initializer. Other threads keep using _SESSION.
+    The session is appended to opened; the caller closes those once the
+    threads are done.
+    """
+    _THREAD.session = _make_session()
+    opened.append(_THREAD.session)
+
+
+def _current_session() -> requests.Session:
+    return getattr(_THREAD, "session", _SESSION)
 
 
 class RequestResult:
@@ -18,12 +58,66 @@ class RequestResult:
         self.error: str | None = None
         self.raw_text: str = ""
 
+    # Fields derived from the response are filled in on first access:
+    # most runs never display or snapshot the headers, and nothing in the
+    # CLI reads raw_text, so neither copy nor decode is paid up front.
+    _response: requests.Response | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        if self._headers is None:
+            self._headers = dict(self._response.headers)
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: dict[str, str]) -> None:
+        self._headers = value
+
+    @property
+    def raw_text(self) -> str:
+        if self._raw_text is None:
+            self._raw_text = self._response.text
+        return self._raw_text
+
+    @raw_text.setter
+    def raw_text(self, value: str) -> None:
+        self._raw_text = value
+
+    def _bind_response(self, resp: requests.Response) -> None:
+        self._response = resp
+        self._headers = None
+        self._raw_text = None
+
+
+def _parse_body(result: RequestResult) -> Any:
+    """Parse the bound response's body as JSON, falling back to its text.
+
+    UTF-8 (or undeclared) bodies are parsed straight from the bytes:
+    json.loads detects UTF-8/16/32 itself, so a JSON body is never decoded
+    to str. Otherwise the text comes from result.raw_text, which caches
+    it, so the body is decoded at most once per response.
+    """
+    resp = result._response
+    encoding = resp.encoding
+    if encoding is None or encoding.lower() in ("utf-8", "utf8"):
+        try:
+            return json.loads(resp.content)
+        except UnicodeDecodeError:
+            pass  # not UTF-8 after all; parse the text requests decodes
+        except ValueError:
+            return result.raw_text
+    text = result.raw_text
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
 
 def execute_request(
     method: str,
     url: str,
     headers: dict[str, str] | None = None,
-    body: str | None = None,
+    body: str | bytes | None = None,
     timeout: int = 30,
     form_data: dict | None = None,
 ) -> RequestResult:
@@ -35,6 +129,7 @@ def execute_request(
     - Catches exceptions gracefully
     - Never raises - always returns RequestResult with error field set
 
+    body may be a str (sent UTF-8 encoded) or already-encoded bytes.
     When form_data is provided (dict with 'data' and 'files' keys),
     sends a multipart/form-data request instead of a raw body.
     """
@@ -59,20 +154,18 @@ def execute_request(
             kwargs["files"] = form_data.get("files", {})
         else:
             kwargs["headers"] = headers
-            kwargs["data"] = body.encode("utf-8") if body else None
+            # str bodies are encoded once here; bytes go to requests as-is
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            kwargs["data"] = body or None
 
         start = time.monotonic()
-        resp = requests.request(**kwargs)
+        resp = _current_session().request(**kwargs)
         result.elapsed_ms = (time.monotonic() - start) * 1000
 
         result.status_code = resp.status_code
-        result.headers = dict(resp.headers)
-        result.raw_text = resp.text
-
-        try:
-            result.body = resp.json()
-        except (json.JSONDecodeError, ValueError):
-            result.body = resp.text
+        result._bind_response(resp)
+        result.body = _parse_body(result)
 
     except requests.exceptions.Timeout:
         result.error = f"Request timed out after {timeout}s"
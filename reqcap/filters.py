@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
-import re
+import operator
+from collections.abc import Callable, Sequence
 from typing import Any
 
 # ---------------------------------------------------------------------------
@@ -14,8 +17,11 @@ from typing import Any
 #   (start, stop)    → Python-style slice  e.g. [2:], [:-1], [1:3]
 # ---------------------------------------------------------------------------
 
-_INT_RE = re.compile(r"^-?\d+$")
-_SLICE_RE = re.compile(r"^(-?\d*):(-?\d*)$")
+
+def _is_int(text: str) -> bool:
+    """True for an optional '-' followed by decimal digits (what int() accepts here)."""
+    digits = text[1:] if text[:1] == "-" else text
+    return digits.isdecimal()
 
 
 def _parse_path_segments(path: str) -> list[Any]:
@@ -32,34 +38,42 @@ def _parse_path_segments(path: str) -> list[Any]:
       data[:-1]              → key, (None,-1)
       headers[Content-Type]  → key, key   (bracket key access)
       body.items.2           → key, key, 2 (numeric dot segment = index)
+
+    Each dot-separated part is scanned once, without regexes: an optional
+    key, then [...] groups running to the end of the part. A part whose
+    brackets don't close that way is taken as a plain key.
     """
-    path = path.strip()
     segments: list = []
 
-    for part in path.split("."):
+    for part in path.strip().split("."):
         part = part.strip()
         if not part:
             continue
 
-        # Check for bracket(s) attached to this part: key[...] or just [...]
-        # There may be multiple brackets: key[a][0]
-        m = re.match(r"^([^\[]*)((?:\[[^\]]*\])+)$", part)
-        if m:
-            key_part = m.group(1).strip()
-            brackets_raw = m.group(2)
-
-            if key_part:
-                segments.append(key_part)
-
-            # Extract each [...] group
-            for bracket in re.findall(r"\[([^\]]*)\]", brackets_raw):
-                bracket = bracket.strip()
-                segments.append(_classify_bracket(bracket))
-        elif _INT_RE.match(part):
+        open_at = part.find("[")
+        if open_at == -1:
             # Bare numeric segment like body.items.2 → treat as index
-            segments.append(int(part))
-        else:
-            segments.append(part)
+            segments.append(int(part) if _is_int(part) else part)
+            continue
+
+        # Split off each [...] group; there may be several: key[a][0]
+        brackets: list[str] = []
+        i = open_at
+        while i < len(part) and part[i] == "[":
+            close_at = part.find("]", i + 1)
+            if close_at == -1:
+                break
+            brackets.append(part[i + 1 : close_at])
+            i = close_at + 1
+        if i != len(part):
+            segments.append(part)  # malformed brackets → literal key
+            continue
+
+        key_part = part[:open_at].strip()
+        if key_part:
+            segments.append(key_part)
+        for bracket in brackets:
+            segments.append(_classify_bracket(bracket.strip()))
 
     return segments
 
@@ -69,13 +83,11 @@ def _classify_bracket(content: str) -> str | int | tuple[int | None, int | None]
     if not content:
         return None  # [] → iterate
 
-    sm = _SLICE_RE.match(content)
-    if sm:
-        start = int(sm.group(1)) if sm.group(1) else None
-        stop = int(sm.group(2)) if sm.group(2) else None
-        return (start, stop)
-
-    if _INT_RE.match(content):
+    start, colon, stop = content.partition(":")
+    if colon:
+        if (not start or _is_int(start)) and (not stop or _is_int(stop)):
+            return (int(start) if start else None, int(stop) if stop else None)
+    elif _is_int(content):
         return int(content)
 
     # Non-numeric → dict key
@@ -87,11 +99,30 @@ def _classify_bracket(content: str) -> str | int | tuple[int | None, int | None]
 # ---------------------------------------------------------------------------
 
 
-def _ci_get(d: dict[str, Any], key: str) -> tuple[str | None, Any]:
-    """Case-insensitive dict lookup.  Returns (actual_key, value)."""
+# Maps id(source dict) -> {lowercased key: actual key}. Only source data is
+# indexed: it stays alive and unchanged for the whole filter_response call,
+# so ids are stable. Result-tree dicts are mutated and always scanned.
+_CiIndex = dict[int, dict[str, str]]
+
+
+def _ci_get(d: dict[str, Any], key: str, index: _CiIndex | None = None) -> tuple[str | None, Any]:
+    """Case-insensitive dict lookup.  Returns (actual_key, value).
+
+    With *index*, a miss on the exact key builds d's lowercase key map once
+    and later misses on the same dict are a single lookup.
+    """
     if key in d:
         return key, d[key]
     lower = key.lower()
+    if index is not None:
+        lowered = index.get(id(d))
+        if lowered is None:
+            lowered = {}
+            for k in d:
+                lowered.setdefault(k.lower(), k)  # first match wins, as in the scan
+            index[id(d)] = lowered
+        actual = lowered.get(lower)
+        return (actual, d[actual]) if actual is not None else (None, None)
     for k, v in d.items():
         if k.lower() == lower:
             return k, v
@@ -103,7 +134,9 @@ def _ci_get(d: dict[str, Any], key: str) -> tuple[str | None, Any]:
 # ---------------------------------------------------------------------------
 
 
-def _get_value(data: Any, segments: list[Any]) -> tuple[bool, Any]:
+def _get_value(
+    data: Any, segments: Sequence[Any], index: _CiIndex | None = None
+) -> tuple[bool, Any]:
     """Walk *simple* segments (str / int) to extract a value.
 
     Does NOT handle None (iter) or tuple (slice) — those are dealt with at
@@ -115,7 +148,7 @@ def _get_value(data: Any, segments: list[Any]) -> tuple[bool, Any]:
             return False, None
         if isinstance(seg, str):
             if isinstance(current, dict):
-                actual, val = _ci_get(current, seg)
+                actual, val = _ci_get(current, seg, index)
                 if actual is None:
                     return False, None
                 current = val
@@ -135,27 +168,69 @@ def _get_value(data: Any, segments: list[Any]) -> tuple[bool, Any]:
     return True, current
 
 
-def _resolve_list_segment(arr: list[Any], seg: Any) -> list[tuple[int, Any]]:
+_Getter = Callable[[Any, _CiIndex | None], tuple[bool, Any]]
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_getter(segments: tuple[Any, ...]) -> _Getter:
+    """Build a getter equivalent to ``_get_value(item, segments, index)``.
+
+    Used for the per-element suffix of ``data[].field`` paths, where the
+    same segments are walked once per list item. Paths made only of keys
+    get a specialized walker that probes the exact key inline; anything
+    else falls back to _get_value.
+    """
+    if not all(isinstance(seg, str) for seg in segments):
+        return lambda item, index=None: _get_value(item, segments, index)
+
+    if len(segments) == 1:
+        (key,) = segments
+
+        def get_key(item: Any, index: _CiIndex | None = None) -> tuple[bool, Any]:
+            if isinstance(item, dict):
+                if key in item:
+                    return True, item[key]
+                actual, val = _ci_get(item, key, index)
+                if actual is not None:
+                    return True, val
+            return False, None
+
+        return get_key
+
+    def get_keys(item: Any, index: _CiIndex | None = None) -> tuple[bool, Any]:
+        current = item
+        for key in segments:
+            if not isinstance(current, dict):
+                return False, None
+            if key in current:
+                current = current[key]
+            else:
+                actual, current = _ci_get(current, key, index)
+                if actual is None:
+                    return False, None
+        return True, current
+
+    return get_keys
+
+
+def _resolve_list_segment(arr: list[Any], seg: Any) -> range:
     """Given a list and a segment (None / int / slice-tuple), return the
-    (index, element) pairs that should be processed.
+    indices of the elements that should be processed.
+
+    A range is returned rather than (index, element) pairs: it is lazy,
+    can be iterated more than once, and its truthiness says whether
+    anything matched.
     """
     if seg is None:
-        return list(enumerate(arr))
+        return range(len(arr))
     if isinstance(seg, int):
-        try:
-            val = arr[seg]
-            # normalise negative index
-            idx = seg if seg >= 0 else len(arr) + seg
-            return [(idx, val)]
-        except IndexError:
-            return []
+        # normalise negative index
+        idx = seg if seg >= 0 else len(arr) + seg
+        return range(idx, idx + 1) if 0 <= idx < len(arr) else range(0)
     if isinstance(seg, tuple):
         start, stop = seg
-        sl = slice(start, stop)
-        items = arr[sl]
-        indices = range(*sl.indices(len(arr)))
-        return list(zip(indices, items, strict=False))
-    return []
+        return range(*slice(start, stop).indices(len(arr)))
+    return range(0)
 
 
 # ---------------------------------------------------------------------------
@@ -163,7 +238,7 @@ def _resolve_list_segment(arr: list[Any], seg: Any) -> list[tuple[int, Any]]:
 # ---------------------------------------------------------------------------
 
 
-def _ensure_container(target: Any, segments: list[Any]) -> Any:
+def _ensure_container(target: Any, segments: Sequence[Any]) -> Any:
     """Walk segments in the *result* tree, creating dicts/lists as needed."""
     for i, seg in enumerate(segments[:-1]):
         next_seg = segments[i + 1]
@@ -175,13 +250,12 @@ def _ensure_container(target: Any, segments: list[Any]) -> Any:
                 target[seg] = child
             target = child
         elif isinstance(seg, int) and isinstance(target, list):
-            while len(target) <= seg:
-                target.append({})
+            target.extend({} for _ in range(seg + 1 - len(target)))
             target = target[seg]
     return target
 
 
-def _set_in_result(result: dict[str, Any], segments: list[Any], value: Any) -> None:
+def _set_in_result(result: dict[str, Any], segments: Sequence[Any], value: Any) -> None:
     """Set a scalar value at the given segment path in the result dict."""
     if not segments:
         return
@@ -190,8 +264,7 @@ def _set_in_result(result: dict[str, Any], segments: list[Any], value: Any) -> N
     if isinstance(last, str) and isinstance(target, dict):
         target[last] = value
     elif isinstance(last, int) and isinstance(target, list):
-        while len(target) <= last:
-            target.append(None)
+        target.extend([None] * (last + 1 - len(target)))
         target[last] = value
 
 
@@ -200,42 +273,70 @@ def _set_in_result(result: dict[str, Any], segments: list[Any], value: Any) -> N
 # ---------------------------------------------------------------------------
 
 
-def _apply_spec(data: Any, spec: str, result: dict) -> None:
-    """Apply one field-path spec to *data*, merging into *result*."""
-    segments = _parse_path_segments(spec)
-    if not segments:
-        return
+@functools.lru_cache(maxsize=512)
+def _compile_filter_spec(spec: str) -> tuple[tuple[Any, ...], int | None]:
+    """Parse a filter spec once into (segments, collection index).
 
-    # Find the first "collection" segment: None (iter), tuple (slice), or
-    # a negative int (can't build result tree at negative index, must normalise).
-    coll_idx = None
+    The collection index points at the first segment that needs list
+    handling: None (iter), tuple (slice), or a negative int (can't build
+    the result tree at a negative index, must normalise). It is None for
+    simple scalar paths.
+    """
+    segments = tuple(_parse_path_segments(spec))
     for i, seg in enumerate(segments):
         if seg is None or isinstance(seg, tuple):
-            coll_idx = i
-            break
+            return segments, i
         if isinstance(seg, int) and seg < 0:
-            coll_idx = i
-            break
+            return segments, i
+    return segments, None
+
+
+def _apply_spec(data: Any, spec: str, result: dict, index: _CiIndex | None = None) -> None:
+    """Apply one field-path spec to *data*, merging into *result*."""
+    segments, coll_idx = _compile_filter_spec(spec)
+    if not segments:
+        return
 
     if coll_idx is None:
         # Simple scalar path — no iteration / slicing
-        found, value = _get_value(data, segments)
+        found, value = _get_value(data, segments, index)
         if found:
             _set_in_result(result, segments, value)
         return
 
-    # --- collection path ---
-    prefix = segments[:coll_idx]  # path to the list
-    coll_seg = segments[coll_idx]  # None | (start,stop) | negative int
-    suffix = segments[coll_idx + 1 :]  # path inside each element
-
+    _apply_collection(
+        data,
+        segments[:coll_idx],  # path to the list
+        segments[coll_idx],  # None | (start,stop) | negative int
+        [segments[coll_idx + 1 :]],  # path inside each element
+        result,
+        index,
+    )
+
+
+def _apply_collection(
+    data: Any,
+    prefix: tuple[Any, ...],
+    coll_seg: Any,
+    suffixes: list[tuple[Any, ...]],
+    result: dict,
+    index: _CiIndex | None,
+) -> None:
+    """Apply the element *suffixes* of specs sharing one list *prefix*.
+
+    The prefix is resolved, and its result container built, once for all
+    suffixes. Several suffixes are only passed for iteration (``[]``),
+    where each element is visited once and its suffixes applied in order;
+    that is equivalent to applying the specs one after another, because
+    element j only ever writes to result slot j.
+    """
     # Resolve prefix
-    found, arr = _get_value(data, prefix)
+    found, arr = _get_value(data, prefix, index)
     if not found or not isinstance(arr, list):
         return
 
-    pairs = _resolve_list_segment(arr, coll_seg)
-    if not pairs:
+    indices = _resolve_list_segment(arr, coll_seg)
+    if not indices:
         return
 
     # Navigate / create the list container in result
@@ -249,39 +350,56 @@ def _apply_spec(data: Any, spec: str, result: dict) -> None:
                 container[seg] = child
             container = child
         elif isinstance(seg, int) and isinstance(container, list):
-            while len(container) <= seg:
-                container.append({})
+            container.extend({} for _ in range(seg + 1 - len(container)))
             container = container[seg]
 
     if not isinstance(container, list):
         return
 
+    getters = [(suffix, _compile_getter(suffix)) for suffix in suffixes]
+
     # For iteration (None), we keep indices aligned to original array
     # For slices, we produce a compact list
     if coll_seg is None:
         # Ensure container is at least as long as the source array
-        while len(container) < len(arr):
-            container.append({})
-        for j, item in pairs:
-            if suffix:
-                found, value = _get_value(item, suffix)
-                if found:
-                    if not isinstance(container[j], dict):
-                        container[j] = {}
-                    _set_in_result(container[j], suffix, value)
-            else:
-                container[j] = item
+        # (one fresh dict per slot; [{}] * n would alias them)
+        container.extend({} for _ in range(len(arr) - len(container)))
+        for j in indices:
+            item = arr[j]
+            for suffix, get in getters:
+                if suffix:
+                    found, value = get(item, index)
+                    if found:
+                        if not isinstance(container[j], dict):
+                            container[j] = {}
+                        _set_in_result(container[j], suffix, value)
+                else:
+                    container[j] = item
     else:
-        # Slice — produce compact result list
-        for _j, item in pairs:
-            if suffix:
-                found, value = _get_value(item, suffix)
-                if found:
-                    entry: dict = {}
-                    _set_in_result(entry, suffix, value)
-                    container.append(entry)
-            else:
-                container.append(item)
+        # Slice — produce compact result list, one run of entries per suffix
+        for suffix, get in getters:
+            for j in indices:
+                item = arr[j]
+                if suffix:
+                    found, value = get(item, index)
+                    if found:
+                        entry: dict = {}
+                        _set_in_result(entry, suffix, value)
+                        container.append(entry)
+                else:
+                    container.append(item)
+
+
+def _iter_group_key(spec: str) -> Any:
+    """Group key for filter_response: the list path of a ``[]`` spec.
+
+    Specs iterating the same list share the key (their segments up to and
+    including the ``[]``); every other spec is its own group.
+    """
+    segments, coll_idx = _compile_filter_spec(spec)
+    if coll_idx is not None and segments[coll_idx] is None:
+        return segments[: coll_idx + 1]
+    return spec
 
 
 # ---------------------------------------------------------------------------
@@ -305,7 +423,9 @@ def filter_response(data: Any, field_specs: list[str]) -> Any:
     if not field_specs:
         return data
 
-    cleaned = [s.strip() for s in field_specs if s.strip()]
+    # Ordered dedup: repeated specs are applied once, and result keys keep
+    # the order the specs were given in.
+    cleaned = dict.fromkeys(spec for s in field_specs if (spec := s.strip()))
     if not cleaned or "*" in cleaned:
         return data
 
@@ -313,31 +433,46 @@ def filter_response(data: Any, field_specs: list[str]) -> Any:
         return data
 
     result: dict = {}
-    for spec in cleaned:
-        _apply_spec(data, spec, result)
+    index: _CiIndex = {}
+    # Consecutive specs over the same list (data[].id, data[].name, ...)
+    # walk it once. Only adjacent specs are merged, so application order
+    # relative to the other specs is unchanged.
+    for key, group in itertools.groupby(cleaned, key=_iter_group_key):
+        if isinstance(key, tuple):
+            suffixes = [_compile_filter_spec(spec)[0][len(key) :] for spec in group]
+            _apply_collection(data, key[:-1], None, suffixes, result, index)
+        else:
+            _apply_spec(data, key, result, index)
 
     return result
 
 
-def extract_value(data: Any, path: str) -> Any:
-    """Extract a value from data at the given path.
+@functools.lru_cache(maxsize=512)
+def _compile_extract_path(path: str) -> tuple[tuple[Any, ...], int | None]:
+    """Parse an export/assert path once into (segments, collection index).
 
-    Used for --export (extracting values from response for chaining).
-    Strips a leading ``body.`` prefix for convenience.
-    Case-insensitive key matching.
+    Strips a leading ``body.`` prefix. The collection index points at the
+    first iter/slice segment, or is None for simple paths.
     """
     path = path.strip()
     if path.lower().startswith("body."):
         path = path[5:]
 
-    segments = _parse_path_segments(path)
-
-    # Check for collection segment
-    coll_idx = None
+    segments = tuple(_parse_path_segments(path))
     for i, seg in enumerate(segments):
         if seg is None or isinstance(seg, tuple):
-            coll_idx = i
-            break
+            return segments, i
+    return segments, None
+
+
+def extract_value(data: Any, path: str) -> Any:
+    """Extract a value from data at the given path.
+
+    Used for --export (extracting values from response for chaining).
+    Strips a leading ``body.`` prefix for convenience.
+    Case-insensitive key matching.
+    """
+    segments, coll_idx = _compile_extract_path(path)
 
     if coll_idx is not None:
         prefix = segments[:coll_idx]
@@ -348,11 +483,13 @@ def extract_value(data: Any, path: str) -> Any:
         if not found or not isinstance(arr, list):
             return None
 
-        pairs = _resolve_list_segment(arr, coll_seg)
+        indices = _resolve_list_segment(arr, coll_seg)
+        get = _compile_getter(suffix)
         results = []
-        for _, item in pairs:
+        for j in indices:
+            item = arr[j]
             if suffix:
-                ok, val = _get_value(item, suffix)
+                ok, val = get(item, None)
                 if ok:
                     results.append(val)
             else:
@@ -363,23 +500,54 @@ def extract_value(data: Any, path: str) -> Any:
     return value if found else None
 
 
+@functools.lru_cache(maxsize=256)
 def parse_assert(expr: str) -> tuple[str, str, str]:
     """Parse an assertion expression like 'status=200' or 'body.field!=value'.
 
     Returns (path, operator, expected_str).
     Checks for != first (2-char), then = (1-char).
     """
-    # Check for != first
-    idx = expr.find("!=")
-    if idx != -1:
-        return (expr[:idx].strip(), "!=", expr[idx + 2 :].strip())
-    # Then =
-    idx = expr.find("=")
-    if idx != -1:
-        return (expr[:idx].strip(), "=", expr[idx + 1 :].strip())
+    for op in ("!=", "="):
+        path, sep, expected = expr.partition(op)
+        if sep:
+            return (path.strip(), op, expected.strip())
     raise ValueError(f"Invalid assert expression (no = or !=): {expr}")
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_assert(expr: str) -> tuple[Callable[[Any], Any], Callable[[str, str], bool], str]:
+    """Compile an assertion once into (actual getter, comparison, expected).
+
+    The getter takes a RequestResult; the path dispatch happens here
+    rather than on every evaluation.
+    """
+    path, op, expected = parse_assert(expr)
+
+    if path == "status":
+        getter = operator.attrgetter("status_code")
+    elif path == "body":
+        getter = operator.attrgetter("body")
+    else:
+        # body.x and bare x paths both resolve against the body
+        segments, coll_idx = _compile_extract_path(path)
+        if coll_idx is None:
+            get = _compile_getter(segments)
+
+            def getter(result: Any) -> Any:
+                found, value = get(result.body, None)
+                return value if found else None
+
+        else:
+
+            def getter(result: Any) -> Any:
+                return extract_value(result.body, path)
+
+    return getter, operator.eq if op == "=" else operator.ne, expected
+
+
+_STR_OPENER = {dict: "{", list: "["}
+
+
 def evaluate_assert(expr: str, result) -> tuple[bool, str]:
     """Evaluate an assertion against a request result.
 
@@ -387,31 +555,29 @@ def evaluate_assert(expr: str, result) -> tuple[bool, str]:
     On failure, message is 'ASSERT FAILED: expr (actual: val)'.
     On success, message is 'ASSERT PASSED: expr'.
     """
-    path, op, expected = parse_assert(expr)
+    getter, compare, expected = _compile_assert(expr)
+    actual = getter(result)
 
-    # Resolve actual value
-    if path == "status":
-        actual = result.status_code
-    elif path.startswith("body."):
-        actual = extract_value(result.body, path)
-    elif path == "body":
-        actual = result.body
-    else:
-        actual = extract_value(result.body, path)
+    # str() of a dict or list starts with its bracket, so when expected
+    # doesn't, != holds without stringifying a possibly large body.
+    if compare is operator.ne:
+        bracket = _STR_OPENER.get(type(actual))
+        if bracket is not None and not expected.startswith(bracket):
+            return (True, f"ASSERT PASSED: {expr}")
 
     # Compare as strings
     actual_str = str(actual) if actual is not None else ""
 
-    if op == "=":
-        passed = actual_str == expected
-    else:  # !=
-        passed = actual_str != expected
-
-    if passed:
+    if compare(actual_str, expected):
         return (True, f"ASSERT PASSED: {expr}")
     return (False, f"ASSERT FAILED: {expr} (actual: {actual_str})")
 
 
+_dumps_indent = json.JSONEncoder(indent=2).encode
+# A tuple, not dict | list: the union would be rebuilt on every check.
+_JSON_CONTAINER = (dict, list)
+
+
 def format_output(
     result,  # RequestResult from executor.py
     filter_config: dict | None = None,
@@ -430,8 +596,8 @@ def format_output(
 
     if raw:
         body = result.body
-        if isinstance(body, dict | list):
-            return json.dumps(body, indent=2)
+        if isinstance(body, _JSON_CONTAINER):
+            return _dumps_indent(body)
         return str(body) if body is not None else ""
 
     show_status = True
@@ -452,18 +618,16 @@ def format_output(
 
     if show_headers and result.headers:
         lines.append("HEADERS:")
-        for key, value in result.headers.items():
-            lines.append(f"  {key}: {value}")
+        lines.extend(f"  {key}: {value}" for key, value in result.headers.items())
 
     body = result.body
     if body is not None:
-        if body_fields and isinstance(body, dict | list):
-            body = filter_response(body, body_fields)
-
-        lines.append("BODY:")
-        if isinstance(body, dict | list):
-            lines.append(json.dumps(body, indent=2))
+        # filter_response keeps containers containers, so check once
+        if isinstance(body, _JSON_CONTAINER):
+            if body_fields:
+                body = filter_response(body, body_fields)
+            lines.extend(("BODY:", _dumps_indent(body)))
         else:
-            lines.append(str(body))
+            lines.extend(("BODY:", str(body)))
 
     return "\n".join(lines)
@@ -1,37 +1,138 @@
 """Shared fixtures for reqcap scenario tests."""
 
+import functools
 import json
+import shutil
+from unittest.mock import Mock
 
 import pytest
+import yaml
 from click.testing import CliRunner
 
-from reqcap import core
+from reqcap import core, executor
 from reqcap.executor import RequestResult
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def runner():
+    # CliRunner keeps no state between invokes, so one serves the session.
     return CliRunner()
 
 
+@pytest.fixture(scope="session")
+def template_bytes():
+    """Serialized bodies for templates that many tests write unchanged."""
+    templates = {
+        "health.yaml": {"method": "GET", "url": "/health"},
+        "login.yaml": {
+            "method": "POST",
+            "url": "/api/auth/login",
+            "body": {"email": "", "password": ""},
+            "exports": {"token": "body.access_token"},
+        },
+    }
+    return {name: dump_yaml(tpl).encode() for name, tpl in templates.items()}
+
+
+@pytest.fixture
+def mock_exec(monkeypatch):
+    """Replace reqcap.executor.execute_request with a Mock for one test."""
+    mock = Mock()
+    monkeypatch.setattr(executor, "execute_request", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_req(monkeypatch):
+    """Replace the shared session's request method with a Mock for one test."""
+    mock = Mock()
+    monkeypatch.setattr(executor._SESSION, "request", mock)
+    return mock
+
+
+@pytest.fixture
+def invoke_in(runner, tmp_path, monkeypatch):
+    """runner.invoke(main, ...) with tmp_path as the working directory.
+
+    Unlike a bare os.chdir, the previous cwd is restored after the test.
+    """
+    from reqcap.cli import main
+
+    monkeypatch.chdir(tmp_path)
+    return functools.partial(runner.invoke, main)
+
+
+@pytest.fixture(scope="session")
+def _global_reqcap_root(tmp_path_factory):
+    """Session temp path standing in for ~/.reqcap (not created here)."""
+    return tmp_path_factory.mktemp("fake_home") / ".reqcap"
+
+
+def _patch_global_paths(monkeypatch, root):
+    monkeypatch.setattr(core, "GLOBAL_DIR", root)
+    monkeypatch.setattr(core, "GLOBAL_CONFIG", root / "config.yaml")
+    monkeypatch.setattr(core, "GLOBAL_TEMPLATES_DIR", root / "templates")
+    monkeypatch.setattr(core, "GLOBAL_SNAPSHOTS_DIR", root / "snapshots")
+
+
 @pytest.fixture
-def global_reqcap_dir(tmp_path, monkeypatch):
-    """Override the global ~/.reqcap directory to a temp location."""
-    fake_global = tmp_path / "fake_home" / ".reqcap"
-    fake_global.mkdir(parents=True)
-    monkeypatch.setattr(core, "GLOBAL_DIR", fake_global)
-    monkeypatch.setattr(core, "GLOBAL_CONFIG", fake_global / "config.yaml")
-    monkeypatch.setattr(core, "GLOBAL_TEMPLATES_DIR", fake_global / "templates")
-    monkeypatch.setattr(core, "GLOBAL_SNAPSHOTS_DIR", fake_global / "snapshots")
-    return fake_global
+def global_reqcap_dir(_global_reqcap_root, monkeypatch):
+    """Override the global ~/.reqcap directory to a temp location.
+
+    The GLOBAL_* paths are patched for this test only. The directory is
+    shared by the session, created for each test and removed afterwards, so
+    later tests see no global state.
+    """
+    fake_global = _global_reqcap_root
+    _patch_global_paths(monkeypatch, fake_global)
+    shutil.rmtree(fake_global, ignore_errors=True)
+    fake_global.mkdir()
+    yield fake_global
+    shutil.rmtree(fake_global, ignore_errors=True)
+
+
+@pytest.fixture
+def no_templates_env(_global_reqcap_root, monkeypatch):
+    """Like global_reqcap_dir, but the global directory is never created.
+
+    For tests that only exercise "not found" paths.
+    """
+    _patch_global_paths(monkeypatch, _global_reqcap_root)
+    return _global_reqcap_root
+
+
+@pytest.fixture(scope="session")
+def _history_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("history")
 
 
 @pytest.fixture(autouse=True)
-def isolate_history(tmp_path, monkeypatch):
-    """Prevent tests from polluting ~/.reqcap_history.json."""
+def isolate_history(_history_dir, monkeypatch):
+    """Prevent tests from polluting ~/.reqcap_history.jsonl.
+
+    Uses one session directory rather than tmp_path, so tests that never ask
+    for a temp dir don't get one created; the file is removed after each test.
+    """
     from reqcap import cli
 
-    monkeypatch.setattr(cli, "HISTORY_FILE", tmp_path / "test_history.json")
+    history_file = _history_dir / "test_history.jsonl"
+    monkeypatch.setattr(cli, "HISTORY_FILE", history_file)
+    yield
+    history_file.unlink(missing_ok=True)
+
+
+def write_file(path, data):
+    """Write str or bytes to path, creating parent directories as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, bytes):
+        path.write_bytes(data)
+    else:
+        path.write_text(data)
 
 
 def make_request_result(
@@ -53,3 +154,31 @@ def make_request_result(
         json.dumps(body) if isinstance(body, dict | list) else str(body or "")
     )
     return r
+
+
+def _freeze(obj):
+    # Type-tagged so 1, 1.0 and True (equal as dict keys) stay distinct
+    if type(obj) is dict:
+        return dict, tuple((k, _freeze(v)) for k, v in obj.items())
+    if type(obj) is list:
+        return list, tuple(_freeze(v) for v in obj)
+    return type(obj), obj
+
+
+def _thaw(key):
+    kind, value = key
+    if kind is dict:
+        return {k: _thaw(v) for k, v in value}
+    if kind is list:
+        return [_thaw(v) for v in value]
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _render_yaml(key):
+    return yaml.dump(_thaw(key), Dumper=_Dumper)
+
+
+def dump_yaml(obj):
+    """yaml.dump(obj) with the C dumper, memoized on the value of obj."""
+    return _render_yaml(_freeze(obj))
@@ -1,12 +1,10 @@
 """Scenario tests for reqcap direct mode (METHOD URL)."""
 
-import os
-from unittest.mock import patch
+import pytest
 
-import yaml
+from tests.conftest import dump_yaml, make_request_result
 
-from reqcap.cli import main
-from tests.conftest import make_request_result
+_LARGE_BODY = {"items": [{"id": i, "name": f"item_{i}"} for i in range(500)]}
 
 # ── Scenario 1: Health check happy path ───────────────────────────────────
 
@@ -14,25 +12,21 @@ from tests.conftest import make_request_result
 class TestHealthCheckHappyPath:
     """GET /health returns STATUS/TIME/BODY output."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_output_format(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_output_format(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         mock_exec.return_value = make_request_result(
             status_code=200,
             body={"status": "ok"},
         )
-        result = runner.invoke(main, ["GET", "http://localhost:3000/health"])
+        result = invoke_in(["GET", "http://localhost:3000/health"])
         assert result.exit_code == 0
         assert "STATUS: 200" in result.output
         assert "TIME: 42ms" in result.output
         assert "BODY:" in result.output
         assert '"status": "ok"' in result.output
 
-    @patch("reqcap.executor.execute_request")
-    def test_correct_args_passed(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_correct_args_passed(self, mock_exec, invoke_in, global_reqcap_dir):
         mock_exec.return_value = make_request_result(body={"status": "ok"})
-        runner.invoke(main, ["GET", "http://localhost:3000/health"])
+        invoke_in(["GET", "http://localhost:3000/health"])
         mock_exec.assert_called_once()
         _, kwargs = mock_exec.call_args
         assert kwargs["method"] == "GET"
@@ -46,22 +40,18 @@ class TestHealthCheckHappyPath:
 class TestConnectionRefused:
     """Connection errors produce exit code 1 and error message."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_exit_code_1(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_exit_code_1(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         mock_exec.return_value = make_request_result(
             error="Connection error: [Errno 111] Connection refused",
         )
-        result = runner.invoke(main, ["GET", "http://localhost:9999/health"])
+        result = invoke_in(["GET", "http://localhost:9999/health"])
         assert result.exit_code == 1
 
-    @patch("reqcap.executor.execute_request")
-    def test_error_message(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_error_message(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         mock_exec.return_value = make_request_result(
             error="Connection error: [Errno 111] Connection refused",
         )
-        result = runner.invoke(main, ["GET", "http://localhost:9999/health"])
+        result = invoke_in(["GET", "http://localhost:9999/health"])
         assert "ERROR: Connection error" in result.output
 
 
@@ -71,26 +61,22 @@ class TestConnectionRefused:
 class TestRelativeUrl:
     """Relative URLs need base_url from config."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_no_config_passes_bare_path(self, mock_exec, runner, tmp_path, global_reqcap_dir):
+    def test_no_config_passes_bare_path(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         """Without config, relative URL has no scheme — executor gets bare path."""
-        os.chdir(tmp_path)
         mock_exec.return_value = make_request_result(
             error="Request failed: Invalid URL '/api/health': No scheme supplied. Perhaps you meant https:///api/health?",
         )
-        result = runner.invoke(main, ["GET", "/api/health"])
+        result = invoke_in(["GET", "/api/health"])
         # The CLI passes the bare path through; executor reports the error
         assert result.exit_code == 1
         assert "No scheme supplied" in result.output
 
-    @patch("reqcap.executor.execute_request")
-    def test_with_base_url_in_config(self, mock_exec, runner, tmp_path, global_reqcap_dir):
+    def test_with_base_url_in_config(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         """With base_url in config, relative URL is resolved."""
-        os.chdir(tmp_path)
         cfg = tmp_path / ".reqcap.yaml"
-        cfg.write_text(yaml.dump({"defaults": {"base_url": "http://localhost:3000"}}))
+        cfg.write_text(dump_yaml({"defaults": {"base_url": "http://localhost:3000"}}))
         mock_exec.return_value = make_request_result(body={"ok": True})
-        result = runner.invoke(main, ["GET", "/api/health"])
+        result = invoke_in(["GET", "/api/health"])
         assert result.exit_code == 0
         _, kwargs = mock_exec.call_args
         assert kwargs["url"] == "http://localhost:3000/api/health"
@@ -102,12 +88,9 @@ class TestRelativeUrl:
 class TestLargeResponseNoFilter:
     """Large responses are output in full without truncation."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_full_output(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
-        large_body = {"items": [{"id": i, "name": f"item_{i}"} for i in range(500)]}
-        mock_exec.return_value = make_request_result(body=large_body)
-        result = runner.invoke(main, ["GET", "http://localhost:3000/api/items"])
+    def test_full_output(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
+        mock_exec.return_value = make_request_result(body=_LARGE_BODY)
+        result = invoke_in(["GET", "http://localhost:3000/api/items"])
         assert result.exit_code == 0
         assert '"id": 0' in result.output
         assert '"id": 499' in result.output
@@ -121,38 +104,25 @@ class TestLargeResponseNoFilter:
 class TestHttpErrorExitCode:
     """BUG: HTTP errors (4xx/5xx) return exit code 0."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_404_exit_code_0(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
-        mock_exec.return_value = make_request_result(
-            status_code=404,
-            body={"error": "Not found"},
-        )
-        result = runner.invoke(main, ["GET", "http://localhost:3000/api/missing"])
-        assert result.exit_code == 0  # BUG: should arguably be non-zero
-        assert "STATUS: 404" in result.output
-
-    @patch("reqcap.executor.execute_request")
-    def test_500_exit_code_0(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
-        mock_exec.return_value = make_request_result(
-            status_code=500,
-            body={"error": "Internal server error"},
-        )
-        result = runner.invoke(main, ["GET", "http://localhost:3000/api/crash"])
-        assert result.exit_code == 0  # BUG: should arguably be non-zero
-        assert "STATUS: 500" in result.output
-
-    @patch("reqcap.executor.execute_request")
-    def test_401_exit_code_0(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    @pytest.mark.parametrize(
+        ("status", "path", "error"),
+        [
+            (404, "/api/missing", "Not found"),
+            (500, "/api/crash", "Internal server error"),
+            (401, "/api/protected", "Unauthorized"),
+        ],
+        ids=["404", "500", "401"],
+    )
+    def test_exit_code_0(
+        self, mock_exec, invoke_in, tmp_path, global_reqcap_dir, status, path, error
+    ):
         mock_exec.return_value = make_request_result(
-            status_code=401,
-            body={"error": "Unauthorized"},
+            status_code=status,
+            body={"error": error},
         )
-        result = runner.invoke(main, ["GET", "http://localhost:3000/api/protected"])
+        result = invoke_in(["GET", f"http://localhost:3000{path}"])
         assert result.exit_code == 0  # BUG: should arguably be non-zero
-        assert "STATUS: 401" in result.output
+        assert f"STATUS: {status}" in result.output
 
 
 # ── Scenario 10: Non-JSON response ───────────────────────────────────────
@@ -161,33 +131,29 @@ class TestHttpErrorExitCode:
 class TestNonJsonResponse:
     """Non-JSON bodies are dumped raw; -f is silently ignored on non-JSON."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_html_dumped_raw(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_html_dumped_raw(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         html = "<html><body><h1>Hello</h1></body></html>"
         mock_exec.return_value = make_request_result(
             status_code=200,
             body=html,
             raw_text=html,
         )
-        result = runner.invoke(main, ["GET", "http://localhost:3000/"])
+        result = invoke_in(["GET", "http://localhost:3000/"])
         assert result.exit_code == 0
         assert "<html>" in result.output
         assert "<h1>Hello</h1>" in result.output
 
-    @patch("reqcap.executor.execute_request")
     def test_filter_silently_ignored_on_non_json(
-        self, mock_exec, runner, tmp_path, global_reqcap_dir
+        self, mock_exec, invoke_in, tmp_path, global_reqcap_dir
     ):
         """BUG: -f flag has no effect on non-JSON responses — no warning."""
-        os.chdir(tmp_path)
         html = "<html><body>plain</body></html>"
         mock_exec.return_value = make_request_result(
             status_code=200,
             body=html,
             raw_text=html,
         )
-        result = runner.invoke(main, ["GET", "http://localhost:3000/", "-f", "title"])
+        result = invoke_in(["GET", "http://localhost:3000/", "-f", "title"])
         assert result.exit_code == 0
         # The filter is silently ignored; full body still shown
         assert "plain" in result.output
@@ -199,21 +165,19 @@ class TestNonJsonResponse:
 class TestMethodCasing:
     """Methods are uppercased before sending."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_lowercase_get_uppercased(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
-        mock_exec.return_value = make_request_result(body={})
-        runner.invoke(main, ["get", "http://localhost:3000/health"])
-        _, kwargs = mock_exec.call_args
-        assert kwargs["method"] == "GET"
-
-    @patch("reqcap.executor.execute_request")
-    def test_mixed_case_post_uppercased(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            (["get", "http://localhost:3000/health"], "GET"),
+            (["Post", "http://localhost:3000/api/users", "-b", '{"name":"test"}'], "POST"),
+        ],
+        ids=["lowercase-get", "mixed-case-post"],
+    )
+    def test_method_uppercased(self, mock_exec, invoke_in, global_reqcap_dir, args, expected):
         mock_exec.return_value = make_request_result(body={})
-        runner.invoke(main, ["Post", "http://localhost:3000/api/users", "-b", '{"name":"test"}'])
+        invoke_in(args)
         _, kwargs = mock_exec.call_args
-        assert kwargs["method"] == "POST"
+        assert kwargs["method"] == expected
 
 
 # ── Scenario 20: POST without body ───────────────────────────────────────
@@ -222,19 +186,15 @@ class TestMethodCasing:
 class TestPostBody:
     """POST with and without -b body."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_post_no_body(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_post_no_body(self, mock_exec, invoke_in, global_reqcap_dir):
         mock_exec.return_value = make_request_result(body={})
-        runner.invoke(main, ["POST", "http://localhost:3000/api/trigger"])
+        invoke_in(["POST", "http://localhost:3000/api/trigger"])
         _, kwargs = mock_exec.call_args
         assert kwargs["body"] is None
 
-    @patch("reqcap.executor.execute_request")
-    def test_post_with_body(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_post_with_body(self, mock_exec, invoke_in, global_reqcap_dir):
         mock_exec.return_value = make_request_result(body={"id": 1})
-        runner.invoke(main, ["POST", "http://localhost:3000/api/users", "-b", '{"name":"test"}'])
+        invoke_in(["POST", "http://localhost:3000/api/users", "-b", '{"name":"test"}'])
         _, kwargs = mock_exec.call_args
         assert kwargs["body"] == '{"name":"test"}'
 
@@ -245,16 +205,14 @@ class TestPostBody:
 class TestNoArgs:
     """No arguments shows help and exits cleanly."""
 
-    def test_shows_help(self, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
-        result = runner.invoke(main, [])
+    def test_shows_help(self, invoke_in, tmp_path, global_reqcap_dir):
+        result = invoke_in([])
         assert result.exit_code == 0
         # Help text includes mode descriptions
         assert "MODES" in result.output or "Direct" in result.output
 
-    def test_exit_code_0(self, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
-        result = runner.invoke(main, [])
+    def test_exit_code_0(self, invoke_in, tmp_path, global_reqcap_dir):
+        result = invoke_in([])
         assert result.exit_code == 0
 
 
@@ -264,28 +222,67 @@ class TestNoArgs:
 class TestTimeout:
     """--timeout is passed through to executor; default is 30."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_custom_timeout_passed(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    @pytest.mark.parametrize(
+        ("extra", "expected"),
+        [(["--timeout", "5"], 5), ([], 30)],
+        ids=["custom", "default"],
+    )
+    def test_timeout_passed(self, mock_exec, invoke_in, global_reqcap_dir, extra, expected):
         mock_exec.return_value = make_request_result(body={})
-        runner.invoke(main, ["GET", "http://localhost:3000/slow", "--timeout", "5"])
+        invoke_in(["GET", "http://localhost:3000/slow", *extra])
         _, kwargs = mock_exec.call_args
-        assert kwargs["timeout"] == 5
+        assert kwargs["timeout"] == expected
 
-    @patch("reqcap.executor.execute_request")
-    def test_timeout_error_message(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_timeout_error_message(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         mock_exec.return_value = make_request_result(
             error="Request timed out after 5s",
         )
-        result = runner.invoke(main, ["GET", "http://localhost:3000/slow", "--timeout", "5"])
+        result = invoke_in(["GET", "http://localhost:3000/slow", "--timeout", "5"])
         assert result.exit_code == 1
         assert "timed out" in result.output
 
-    @patch("reqcap.executor.execute_request")
-    def test_default_timeout_is_30(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
-        mock_exec.return_value = make_request_result(body={})
-        runner.invoke(main, ["GET", "http://localhost:3000/health"])
+
+# ── -H header parsing ────────────────────────────────────────────────────
+
+
+class TestHeaderFlags:
+    """-H 'Name: Value' flags are parsed into request headers."""
+
+    def test_whitespace_trimmed(self, mock_exec, invoke_in, global_reqcap_dir):
+        mock_exec.return_value = make_request_result()
+        invoke_in(
+            ["GET", "http://localhost:3000/x", "-H", "  X-Trace :  abc  ", "-H", "Accept:*/*"],
+        )
         _, kwargs = mock_exec.call_args
-        assert kwargs["timeout"] == 30
+        assert kwargs["headers"] == {"X-Trace": "abc", "Accept": "*/*"}
+
+    def test_value_keeps_colons(self, mock_exec, invoke_in, global_reqcap_dir):
+        mock_exec.return_value = make_request_result()
+        invoke_in(["GET", "http://localhost:3000/x", "-H", "Referer: http://a:1/b"])
+        _, kwargs = mock_exec.call_args
+        assert kwargs["headers"] == {"Referer": "http://a:1/b"}
+
+    def test_malformed_header_ignored(self, mock_exec, invoke_in, global_reqcap_dir):
+        mock_exec.return_value = make_request_result()
+        invoke_in(["GET", "http://localhost:3000/x", "-H", "no-colon", "-H", ": v"])
+        _, kwargs = mock_exec.call_args
+        assert kwargs["headers"] == {}
+
+
+# ── --raw output ─────────────────────────────────────────────────────────
+
+
+class TestRawOutput:
+    """--raw prints just the body, ignoring any filter."""
+
+    def test_json_body_only(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
+        mock_exec.return_value = make_request_result(body={"id": 1, "name": "a"})
+        result = invoke_in(["GET", "http://localhost:3000/x", "--raw", "-f", "id"])
+        assert result.exit_code == 0
+        assert "STATUS:" not in result.output
+        assert '"name": "a"' in result.output
+
+    def test_text_body_verbatim(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
+        mock_exec.return_value = make_request_result(body="plain text")
+        result = invoke_in(["GET", "http://localhost:3000/x", "--raw"])
+        assert result.output == "plain text\n"
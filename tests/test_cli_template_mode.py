@@ -1,12 +1,6 @@
 """Scenario tests for reqcap template mode (-t TEMPLATE)."""
 
-import os
-from unittest.mock import patch
-
-import yaml
-
-from reqcap.cli import main
-from tests.conftest import make_request_result
+from tests.conftest import dump_yaml, make_request_result, write_file
 
 
 def _write_config(path, base_url=None, templates_dir=None, headers=None):
@@ -17,15 +11,13 @@ def _write_config(path, base_url=None, templates_dir=None, headers=None):
         defaults["templates_dir"] = templates_dir
     if headers:
         defaults["headers"] = headers
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.dump({"defaults": defaults}))
+    write_file(path, dump_yaml({"defaults": defaults}))
 
 
 def _write_template(path, **fields):
     tpl = {"method": "GET", "url": "/health"}
     tpl.update(fields)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.dump(tpl))
+    write_file(path, dump_yaml(tpl))
 
 
 # ── Scenario 8: Template relative URL no base_url ────────────────────────
@@ -34,16 +26,14 @@ def _write_template(path, **fields):
 class TestTemplateRelativeUrlNoBaseUrl:
     """Template with relative URL and no base_url → scheme error."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_no_scheme_error(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_no_scheme_error(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         tpl_dir = tmp_path / "templates"
         _write_template(tpl_dir / "health.yaml", url="/api/health", method="GET")
         # No config with base_url
         mock_exec.return_value = make_request_result(
             error="Request failed: Invalid URL '/api/health': No scheme supplied. Perhaps you meant https:///api/health?",
         )
-        result = runner.invoke(main, ["-t", "health"])
+        result = invoke_in(["-t", "health"])
         assert result.exit_code == 1
         assert "No scheme supplied" in result.output
 
@@ -54,22 +44,19 @@ class TestTemplateRelativeUrlNoBaseUrl:
 class TestTemplateNotFoundMessages:
     """Missing template shows search paths, user-created note, and direct mode hint."""
 
-    def test_shows_search_paths(self, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_shows_search_paths(self, invoke_in, tmp_path, global_reqcap_dir):
         tpl_dir = tmp_path / "templates"
         tpl_dir.mkdir()
-        result = runner.invoke(main, ["-t", "invented"])
+        result = invoke_in(["-t", "invented"])
         assert result.exit_code == 1
         assert "invented.yaml" in result.output
 
-    def test_suggests_direct_mode(self, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
-        result = runner.invoke(main, ["-t", "ghost"])
+    def test_suggests_direct_mode(self, invoke_in, tmp_path, no_templates_env):
+        result = invoke_in(["-t", "ghost"])
         assert "reqcap GET <url>" in result.output
 
-    def test_user_created_note(self, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
-        result = runner.invoke(main, ["-t", "phantom"])
+    def test_user_created_note(self, invoke_in, tmp_path, no_templates_env):
+        result = invoke_in(["-t", "phantom"])
         assert "user-created" in result.output
 
 
@@ -79,9 +66,7 @@ class TestTemplateNotFoundMessages:
 class TestGlobalConfigBaseUrl:
     """Global config base_url is used for template relative URLs."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_global_base_url_applied(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_global_base_url_applied(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         # Global config with base_url
         _write_config(
             global_reqcap_dir / "config.yaml",
@@ -92,7 +77,7 @@ class TestGlobalConfigBaseUrl:
         _write_template(global_tpl / "status.yaml", url="/status", method="GET")
 
         mock_exec.return_value = make_request_result(body={"status": "ok"})
-        result = runner.invoke(main, ["-t", "status"])
+        result = invoke_in(["-t", "status"])
         assert result.exit_code == 0
         _, kwargs = mock_exec.call_args
         assert kwargs["url"] == "http://global-api:8080/status"
@@ -104,9 +89,9 @@ class TestGlobalConfigBaseUrl:
 class TestProjectOverridesGlobal:
     """CWD config base_url takes precedence over global."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_cwd_base_url_wins(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_cwd_base_url_wins(
+        self, mock_exec, invoke_in, tmp_path, global_reqcap_dir, template_bytes
+    ):
         # Global config
         _write_config(
             global_reqcap_dir / "config.yaml",
@@ -118,27 +103,29 @@ class TestProjectOverridesGlobal:
             base_url="http://local:3000",
         )
         tpl_dir = tmp_path / "templates"
-        _write_template(tpl_dir / "health.yaml", url="/health", method="GET")
+        tpl_dir.mkdir()
+        (tpl_dir / "health.yaml").write_bytes(template_bytes["health.yaml"])
 
         mock_exec.return_value = make_request_result(body={"ok": True})
-        result = runner.invoke(main, ["-t", "health"])
+        result = invoke_in(["-t", "health"])
         assert result.exit_code == 0
         _, kwargs = mock_exec.call_args
         assert kwargs["url"] == "http://local:3000/health"
 
-    @patch("reqcap.executor.execute_request")
-    def test_headers_from_config_sent(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_headers_from_config_sent(
+        self, mock_exec, invoke_in, tmp_path, global_reqcap_dir, template_bytes
+    ):
         _write_config(
             tmp_path / ".reqcap.yaml",
             base_url="http://local:3000",
             headers={"X-Custom": "from-config"},
         )
         tpl_dir = tmp_path / "templates"
-        _write_template(tpl_dir / "health.yaml", url="/health", method="GET")
+        tpl_dir.mkdir()
+        (tpl_dir / "health.yaml").write_bytes(template_bytes["health.yaml"])
 
         mock_exec.return_value = make_request_result(body={})
-        runner.invoke(main, ["-t", "health"])
+        invoke_in(["-t", "health"])
         _, kwargs = mock_exec.call_args
         assert "X-Custom" in kwargs["headers"]
         assert kwargs["headers"]["X-Custom"] == "from-config"
@@ -150,13 +137,10 @@ class TestProjectOverridesGlobal:
 class TestExplicitConfigNonexistentSilent:
     """BUG: -c pointing to nonexistent file silently proceeds with empty config."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_no_error_for_missing_config(self, mock_exec, runner, tmp_path, global_reqcap_dir):
+    def test_no_error_for_missing_config(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         """BUG: No error emitted when -c points to a missing file."""
-        os.chdir(tmp_path)
         mock_exec.return_value = make_request_result(body={"ok": True})
-        result = runner.invoke(
-            main,
+        result = invoke_in(
             [
                 "-c",
                 "/nonexistent/config.yaml",
@@ -168,21 +152,18 @@ class TestExplicitConfigNonexistentSilent:
         assert result.exit_code == 0
         assert "STATUS: 200" in result.output
 
-    @patch("reqcap.executor.execute_request")
     def test_missing_config_then_relative_url_fails(
         self,
         mock_exec,
-        runner,
+        invoke_in,
         tmp_path,
         global_reqcap_dir,
     ):
         """Missing config → no base_url → relative URL fails."""
-        os.chdir(tmp_path)
         mock_exec.return_value = make_request_result(
             error="Request failed: Invalid URL '/api/health': No scheme supplied. Perhaps you meant https:///api/health?",
         )
-        result = runner.invoke(
-            main,
+        result = invoke_in(
             [
                 "-c",
                 "/nonexistent/config.yaml",
@@ -1,31 +1,29 @@
 """Tests for config file resolution order."""
 
-import os
-
 import pytest
-import yaml
 
 from reqcap import core
+from tests.conftest import dump_yaml, write_file
+
+
+@pytest.fixture(scope="module")
+def _shared_tree(tmp_path_factory):
+    return tmp_path_factory.mktemp("cfgres")
 
 
 @pytest.fixture
-def tmp_project(tmp_path):
-    """Create a temporary project directory and cd into it."""
-    original = os.getcwd()
-    os.chdir(tmp_path)
-    yield tmp_path
-    os.chdir(original)
+def project_dir(_shared_tree, request):
+    """A fresh subdirectory of the module-wide temp tree, named after the test."""
+    sub = _shared_tree / request.node.name
+    sub.mkdir()
+    return sub
 
 
 @pytest.fixture
-def global_reqcap_dir(tmp_path, monkeypatch):
-    """Override the global ~/.reqcap directory to a temp location."""
-    fake_global = tmp_path / "fake_home" / ".reqcap"
-    fake_global.mkdir(parents=True)
-    monkeypatch.setattr(core, "GLOBAL_DIR", fake_global)
-    monkeypatch.setattr(core, "GLOBAL_CONFIG", fake_global / "config.yaml")
-    monkeypatch.setattr(core, "GLOBAL_TEMPLATES_DIR", fake_global / "templates")
-    return fake_global
+def tmp_project(project_dir, monkeypatch):
+    """Create a temporary project directory and cd into it."""
+    monkeypatch.chdir(project_dir)
+    return project_dir
 
 
 def _write_config(path, base_url="http://localhost:3000", templates_dir=None):
@@ -33,8 +31,7 @@ def _write_config(path, base_url="http://localhost:3000", templates_dir=None):
     defaults = {"base_url": base_url}
     if templates_dir is not None:
         defaults["templates_dir"] = templates_dir
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.dump({"defaults": defaults}))
+    write_file(path, dump_yaml({"defaults": defaults}))
 
 
 # ── resolve_config_path ─────────────────────────────────────────────────
@@ -87,6 +84,14 @@ class TestResolveConfigPath:
         result = core.resolve_config_path(None)
         assert result.name == ".reqcap.yaml"
 
+    def test_cwd_directory_with_config_name_skipped(self, tmp_project, global_reqcap_dir):
+        """A directory named like a config candidate is not mistaken for one."""
+        (tmp_project / ".reqcap.yaml").mkdir()
+        _write_config(tmp_project / "reqcap.yml")
+
+        result = core.resolve_config_path(None)
+        assert result == (tmp_project / "reqcap.yml").resolve()
+
     def test_global_config_fallback(self, tmp_project, global_reqcap_dir):
         """~/.reqcap/config.yaml is used when nothing in CWD."""
         _write_config(global_reqcap_dir / "config.yaml", base_url="global")
@@ -114,21 +119,21 @@ class TestLoadConfig:
         assert config["defaults"] == {}
         assert config["_config_dir"] is None
 
-    def test_valid_config_loads_defaults(self, tmp_path):
-        cfg_path = tmp_path / "config.yaml"
+    def test_valid_config_loads_defaults(self, project_dir):
+        cfg_path = project_dir / "config.yaml"
         _write_config(cfg_path, base_url="http://test:8080")
         config = core.load_config(cfg_path)
         assert config["defaults"]["base_url"] == "http://test:8080"
 
-    def test_config_dir_is_set(self, tmp_path):
-        cfg_path = tmp_path / "subdir" / "config.yaml"
+    def test_config_dir_is_set(self, project_dir):
+        cfg_path = project_dir / "subdir" / "config.yaml"
         _write_config(cfg_path)
         config = core.load_config(cfg_path)
-        assert config["_config_dir"] == (tmp_path / "subdir").resolve()
+        assert config["_config_dir"] == (project_dir / "subdir").resolve()
 
-    def test_empty_yaml_returns_empty_defaults(self, tmp_path):
-        cfg_path = tmp_path / "empty.yaml"
+    def test_empty_yaml_returns_empty_defaults(self, project_dir):
+        cfg_path = project_dir / "empty.yaml"
         cfg_path.write_text("")
         config = core.load_config(cfg_path)
         assert config["defaults"] == {}
-        assert config["_config_dir"] == tmp_path.resolve()
+        assert config["_config_dir"] == project_dir.resolve()
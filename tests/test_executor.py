@@ -0,0 +1,128 @@
+"""Tests for executor response handling."""
+
+import requests
+
+from reqcap import executor
+
+
+def _response(content: bytes, encoding: str | None = None) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = content
+    resp.encoding = encoding
+    return resp
+
+
+def _parse(content: bytes, encoding: str | None = None):
+    result = executor.RequestResult()
+    result._bind_response(_response(content, encoding))
+    return executor._parse_body(result)
+
+
+# ── _parse_body ──────────────────────────────────────────────────────────
+
+
+class TestParseBody:
+    def test_json_bytes(self):
+        assert _parse(b'{"name": "caf\xc3\xa9"}') == {"name": "café"}
+
+    def test_utf16_detected(self):
+        assert _parse('{"ok": true}'.encode("utf-16")) == {"ok": True}
+
+    def test_non_json_returns_text(self):
+        assert _parse(b"<html>hi</html>", "utf-8") == "<html>hi</html>"
+
+    def test_empty_body(self):
+        assert _parse(b"") == ""
+
+    def test_declared_charset_used(self):
+        assert _parse('{"name": "café"}'.encode("latin-1"), "ISO-8859-1") == {"name": "café"}
+
+    def test_undeclared_non_utf8_falls_back_to_text(self):
+        assert _parse('{"name": "café"}'.encode("latin-1"))["name"].startswith("caf")
+
+
+# ── RequestResult ────────────────────────────────────────────────────────
+
+
+class TestResultResponseFields:
+    def test_response_headers_copied_on_access(self, mock_req):
+        resp = _response(b"{}")
+        resp.headers["Content-Type"] = "application/json"
+        mock_req.return_value = resp
+
+        result = executor.execute_request("GET", "http://localhost:3000/x")
+        assert type(result.headers) is dict
+        assert result.headers == {"Content-Type": "application/json"}
+        assert result.headers is result.headers
+
+    def test_raw_text_decoded_on_access(self, mock_req):
+        mock_req.return_value = _response(b'{"a": "caf\xc3\xa9"}', "utf-8")
+        result = executor.execute_request("GET", "http://localhost:3000/x")
+        assert result.body == {"a": "café"}
+        assert result._raw_text is None
+        assert result.raw_text == '{"a": "café"}'
+
+    def test_text_body_decoded_once(self, mock_req):
+        decodes = []
+
+        class CountingResponse(requests.Response):
+            @property
+            def text(self):
+                decodes.append(1)
+                return super().text
+
+        resp = CountingResponse()
+        resp.status_code = 200
+        resp._content = b"<p>hi</p>"
+        resp.encoding = "ISO-8859-1"
+        mock_req.return_value = resp
+
+        result = executor.execute_request("GET", "http://localhost:3000/x")
+        assert result.body == result.raw_text == "<p>hi</p>"
+        assert len(decodes) == 1
+
+    def test_assigned_headers_kept(self):
+        result = executor.RequestResult()
+        assert result.headers == {}
+        result.headers = {"X-A": "1"}
+        assert result.headers == {"X-A": "1"}
+        assert result.raw_text == ""
+
+
+# ── Request body ─────────────────────────────────────────────────────────
+
+
+class TestRequestBody:
+    def test_str_body_encoded(self, mock_req):
+        mock_req.return_value = _response(b"{}")
+        executor.execute_request("POST", "http://localhost:3000/x", body='{"n": "é"}')
+        assert mock_req.call_args[1]["data"] == '{"n": "é"}'.encode()
+
+    def test_bytes_body_passed_through(self, mock_req):
+        mock_req.return_value = _response(b"{}")
+        body = b"\x00\xffraw"
+        executor.execute_request("POST", "http://localhost:3000/x", body=body)
+        assert mock_req.call_args[1]["data"] is body
+
+    def test_empty_body_sends_nothing(self, mock_req):
+        mock_req.return_value = _response(b"{}")
+        executor.execute_request("POST", "http://localhost:3000/x", body="")
+        assert mock_req.call_args[1]["data"] is None
+
+
+# ── Sessions ─────────────────────────────────────────────────────────────
+
+
+class TestThreadSession:
+    def test_worker_thread_gets_own_session(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        opened = []
+        with ThreadPoolExecutor(
+            max_workers=2, initializer=executor.use_thread_session, initargs=(opened,)
+        ) as pool:
+            sessions = list(pool.map(lambda _: executor._current_session(), range(2)))
+        assert all(s is not executor._SESSION for s in sessions)
+        assert all(s in opened for s in sessions)
+        assert executor._current_session() is executor._SESSION
@@ -1,6 +1,9 @@
 """Scenario tests for response filtering (filter_response + format_output)."""
 
-from reqcap.filters import filter_response, format_output
+import pytest
+
+from reqcap import filters
+from reqcap.filters import extract_value, filter_response, format_output
 from tests.conftest import make_request_result
 
 # ── Scenario 4: Filter specific fields ────────────────────────────────────
@@ -9,35 +12,69 @@ from tests.conftest import make_request_result
 class TestFilterSpecificFields:
     """filter_response extracts requested fields from JSON bodies."""
 
-    def test_top_level_fields(self):
-        data = {"id": 1, "name": "Alice", "email": "a@b.com", "role": "admin"}
-        result = filter_response(data, ["id", "name"])
-        assert result == {"id": 1, "name": "Alice"}
-
-    def test_nested_field(self):
-        data = {"user": {"profile": {"name": "Bob", "age": 30}, "id": 1}}
-        result = filter_response(data, ["user.profile.name"])
-        assert result == {"user": {"profile": {"name": "Bob"}}}
-
-    def test_array_iteration(self):
-        data = {"data": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]}
-        result = filter_response(data, ["data[].id"])
-        assert result == {"data": [{"id": 1}, {"id": 2}]}
-
-    def test_single_array_index(self):
-        data = {"items": [{"id": 1}, {"id": 2}, {"id": 3}]}
-        result = filter_response(data, ["items[0].id"])
-        assert result == {"items": [{"id": 1}]}
-
-    def test_wildcard_returns_everything(self):
-        data = {"id": 1, "name": "Alice", "extra": True}
-        result = filter_response(data, ["*"])
-        assert result == data
-
-    def test_empty_list_returns_data(self):
-        data = {"id": 1, "name": "Alice"}
-        result = filter_response(data, [])
-        assert result == data
+    @pytest.mark.parametrize(
+        ("data", "fields", "expected"),
+        [
+            (
+                {"id": 1, "name": "Alice", "email": "a@b.com", "role": "admin"},
+                ["id", "name"],
+                {"id": 1, "name": "Alice"},
+            ),
+            (
+                {"user": {"profile": {"name": "Bob", "age": 30}, "id": 1}},
+                ["user.profile.name"],
+                {"user": {"profile": {"name": "Bob"}}},
+            ),
+            (
+                {"data": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]},
+                ["data[].id"],
+                {"data": [{"id": 1}, {"id": 2}]},
+            ),
+            (
+                {"items": [{"id": 1}, {"id": 2}, {"id": 3}]},
+                ["items[0].id"],
+                {"items": [{"id": 1}]},
+            ),
+            (
+                {"id": 1, "name": "Alice", "extra": True},
+                ["*"],
+                {"id": 1, "name": "Alice", "extra": True},
+            ),
+            ({"id": 1, "name": "Alice"}, [], {"id": 1, "name": "Alice"}),
+            (
+                {"User": {"Name": "Bob", "ID": 1, "role": "x"}, "Count": 2},
+                ["user.name", "USER.id", "count", "user.missing"],
+                {"user": {"name": "Bob", "id": 1}, "count": 2},
+            ),
+        ],
+        ids=[
+            "top_level_fields",
+            "nested_field",
+            "array_iteration",
+            "single_array_index",
+            "wildcard_returns_everything",
+            "empty_list_returns_data",
+            "case_insensitive_specs_share_one_dict",
+        ],
+    )
+    def test_filter(self, data, fields, expected):
+        assert filter_response(data, fields) == expected
+
+    def test_array_specs_grouped_match_separate(self):
+        data = {"data": [{"id": 1, "Name": "A", "x": 0}, {"id": 2}, "s"], "n": 1}
+        specs = ["data[].id", "data[].name", "n", "data[].x"]
+        grouped = filter_response(data, specs)
+        separate: dict = {}
+        for spec in specs:
+            filters._apply_spec(data, spec, separate)
+        assert grouped == separate
+        assert grouped == {"data": [{"id": 1, "name": "A", "x": 0}, {"id": 2}, {}], "n": 1}
+
+    def test_duplicate_specs_keep_first_order(self):
+        data = {"id": 1, "name": "Alice", "tags": [1, 2]}
+        result = filter_response(data, ["name", " id", "name", "tags[:1]", "tags[:1]"])
+        assert result == {"name": "Alice", "id": 1, "tags": [1]}
+        assert list(result) == ["name", "id", "tags"]
 
     def test_top_level_array_not_filtered(self):
         """BUG: top-level JSON array silently bypasses filtering."""
@@ -52,26 +89,85 @@ class TestFilterSpecificFields:
 class TestFilterNonExistentField:
     """BUG: Filtering for non-existent fields returns {} instead of warning."""
 
-    def test_missing_field_returns_empty(self):
-        data = {"id": 1, "name": "Alice"}
-        result = filter_response(data, ["nonexistent"])
-        assert result == {}  # BUG: no warning, just empty dict
+    @pytest.mark.parametrize(
+        ("data", "fields", "expected"),
+        [
+            # BUG: no warning, just empty dict
+            ({"id": 1, "name": "Alice"}, ["nonexistent"], {}),
+            # Only the existing field is returned
+            ({"id": 1, "name": "Alice"}, ["id", "nonexistent"], {"id": 1}),
+            ({"user": {"name": "Bob"}}, ["user.missing.deep"], {}),
+            # Array containers are created but fields are empty
+            ({"data": [{"id": 1}, {"id": 2}]}, ["data[].missing"], {"data": [{}, {}]}),
+        ],
+        ids=[
+            "missing_field_returns_empty",
+            "mix_existing_and_missing",
+            "nested_missing",
+            "array_missing_field",
+        ],
+    )
+    def test_filter(self, data, fields, expected):
+        assert filter_response(data, fields) == expected
+
+
+# ── extract_value (exports / asserts) ──────────────────────────────────
+
+
+class TestExtractValue:
+    """extract_value resolves export/assert paths against a body."""
+
+    def test_body_prefix_stripped(self):
+        assert extract_value({"token": "abc"}, "body.token") == "abc"
+
+    def test_case_insensitive_key(self):
+        assert extract_value({"AccessToken": "abc"}, "accesstoken") == "abc"
+
+    def test_iterate_list(self):
+        data = {"data": [{"id": 1}, {"id": 2}]}
+        assert extract_value(data, "body.data[].id") == [1, 2]
 
-    def test_mix_existing_and_missing(self):
-        data = {"id": 1, "name": "Alice"}
-        result = filter_response(data, ["id", "nonexistent"])
-        assert result == {"id": 1}  # only existing field returned
+    def test_slice(self):
+        data = {"items": [1, 2, 3, 4]}
+        assert extract_value(data, "items[1:3]") == [2, 3]
 
-    def test_nested_missing(self):
-        data = {"user": {"name": "Bob"}}
-        result = filter_response(data, ["user.missing.deep"])
-        assert result == {}
+    def test_missing_returns_none(self):
+        assert extract_value({"a": 1}, "body.b") is None
 
-    def test_array_missing_field(self):
-        data = {"data": [{"id": 1}, {"id": 2}]}
-        result = filter_response(data, ["data[].missing"])
-        # Array containers are created but fields are empty
-        assert result == {"data": [{}, {}]}
+    def test_iterate_nested_suffix(self):
+        data = {"data": [{"Meta": {"Tag": "a"}}, {"meta": {}}, {"meta": None}, "x", {"meta": [1]}]}
+        assert extract_value(data, "data[].meta.tag") == ["a"]
+        assert extract_value(data, "data[].meta") == [{"Tag": "a"}, {}, None, [1]]
+
+    def test_repeated_path_fresh_results(self):
+        """Cached path parsing doesn't share result lists between calls."""
+        first = extract_value({"data": [{"id": 1}]}, "data[].id")
+        first.append(99)
+        assert extract_value({"data": [{"id": 1}]}, "data[].id") == [1]
+
+
+# ── Path parsing ───────────────────────────────────────────────────────
+
+
+class TestParsePathSegments:
+    def test_mixed_segments(self):
+        segs = filters._parse_path_segments(" data[0].items[].Name[1:-1].2 ")
+        assert segs == ["data", 0, "items", None, "Name", (1, -1), 2]
+
+    def test_bracket_keys(self):
+        assert filters._parse_path_segments("headers[Content-Type][ x ]") == [
+            "headers",
+            "Content-Type",
+            "x",
+        ]
+        assert filters._parse_path_segments("a[[b]") == ["a", "[b"]
+
+    def test_malformed_brackets_are_literal_keys(self):
+        assert filters._parse_path_segments("a[0]b.c[") == ["a[0]b", "c["]
+
+    def test_non_numeric_slice_is_key(self):
+        assert filters._parse_path_segments("a[-:]") == ["a", "-:"]
+        assert filters._parse_path_segments("a[1:2:3]") == ["a", "1:2:3"]
 
 
 # ── Format integration: filter_config in format_output ────────────────────
@@ -1,21 +1,16 @@
 """Tests for parse_form_fields + executor form_data + CLI integration."""
 
-import os
-from unittest.mock import patch
-
 import pytest
 
-from reqcap.cli import main
 from reqcap.core import parse_form_fields
+from reqcap.executor import execute_request
 from tests.conftest import make_request_result
 
 
 @pytest.fixture
-def tmp_project(tmp_path):
-    original = os.getcwd()
-    os.chdir(tmp_path)
-    yield tmp_path
-    os.chdir(original)
+def tmp_project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
 # ── parse_form_fields ────────────────────────────────────────────────────
@@ -67,10 +62,7 @@ class TestParseFormFields:
 
 
 class TestExecutorFormData:
-    @patch("reqcap.executor.requests.request")
     def test_form_data_passed(self, mock_req, tmp_path):
-        from reqcap.executor import execute_request
-
         mock_resp = type(
             "Response",
             (),
@@ -78,7 +70,8 @@ class TestExecutorFormData:
                 "status_code": 200,
                 "headers": {"Content-Type": "application/json"},
                 "text": '{"ok":true}',
-                "json": lambda self: {"ok": True},
+                "content": b'{"ok":true}',
+                "encoding": None,
             },
         )()
         mock_req.return_value = mock_resp
@@ -95,10 +88,7 @@ class TestExecutorFormData:
         assert "Content-Type" not in call_kwargs.get("headers", {})
         assert call_kwargs["data"] == {"name": "test"}
 
-    @patch("reqcap.executor.requests.request")
     def test_no_form_data_uses_body(self, mock_req):
-        from reqcap.executor import execute_request
-
         mock_resp = type(
             "Response",
             (),
@@ -106,7 +96,8 @@ class TestExecutorFormData:
                 "status_code": 200,
                 "headers": {},
                 "text": "{}",
-                "json": lambda self: {},
+                "content": b"{}",
+                "encoding": None,
             },
         )()
         mock_req.return_value = mock_resp
@@ -120,11 +111,9 @@ class TestExecutorFormData:
 
 
 class TestFormCLI:
-    @patch("reqcap.executor.execute_request")
-    def test_form_basic(self, mock_exec, runner, tmp_project, global_reqcap_dir):
+    def test_form_basic(self, mock_exec, invoke_in, tmp_project, global_reqcap_dir):
         mock_exec.return_value = make_request_result(body={"ok": True})
-        result = runner.invoke(
-            main,
+        result = invoke_in(
             [
                 "POST",
                 "http://localhost:3000/api",
@@ -139,13 +128,11 @@ class TestFormCLI:
         assert call_kwargs["form_data"] is not None
         assert call_kwargs["form_data"]["data"]["name"] == "test"
 
-    @patch("reqcap.executor.execute_request")
-    def test_form_with_file(self, mock_exec, runner, tmp_project, global_reqcap_dir):
+    def test_form_with_file(self, mock_exec, invoke_in, tmp_project, global_reqcap_dir):
         test_file = tmp_project / "readme.md"
         test_file.write_text("# Hello")
         mock_exec.return_value = make_request_result(body={"ok": True})
-        result = runner.invoke(
-            main,
+        result = invoke_in(
             [
                 "POST",
                 "http://localhost:3000/upload",
@@ -159,9 +146,8 @@ class TestFormCLI:
         call_kwargs = mock_exec.call_args[1]
         assert "file" in call_kwargs["form_data"]["files"]
 
-    def test_form_and_body_mutually_exclusive(self, runner, tmp_project, global_reqcap_dir):
-        result = runner.invoke(
-            main,
+    def test_form_and_body_mutually_exclusive(self, invoke_in, tmp_project, global_reqcap_dir):
+        result = invoke_in(
             [
                 "POST",
                 "http://localhost:3000/api",
@@ -0,0 +1,109 @@
+"""Tests for request history (append-only JSONL) + --history/--replay."""
+
+import json
+
+from reqcap import cli
+from tests.conftest import make_request_result
+
+# ── _save_to_history / _load_history ─────────────────────────────────────
+
+
+class TestHistoryFile:
+    def test_appends_one_line_per_request(self):
+        cli._save_to_history("GET", "http://a")
+        cli._save_to_history("POST", "http://b", body='{"x":1}')
+        lines = cli.HISTORY_FILE.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["body"] == '{"x":1}'
+
+    def test_load_newest_first(self):
+        cli._save_to_history("GET", "http://first")
+        cli._save_to_history("GET", "http://second")
+        hist = cli._load_history()
+        assert [e["url"] for e in hist] == ["http://second", "http://first"]
+
+    def test_load_capped_at_max(self, monkeypatch):
+        monkeypatch.setattr(cli, "MAX_HISTORY", 3)
+        for i in range(5):
+            cli._save_to_history("GET", f"http://x/{i}")
+        hist = cli._load_history()
+        assert [e["url"] for e in hist] == ["http://x/4", "http://x/3", "http://x/2"]
+
+    def test_authorization_header_excluded(self):
+        cli._save_to_history(
+            "GET",
+            "http://a",
+            headers={"Authorization": "Bearer secret", "Accept": "application/json"},
+        )
+        entry = cli._load_history()[0]
+        assert entry["headers"] == {"Accept": "application/json"}
+
+    def test_corrupt_line_skipped(self):
+        cli._save_to_history("GET", "http://ok")
+        with open(cli.HISTORY_FILE, "a") as f:
+            f.write("not json\n")
+        assert [e["url"] for e in cli._load_history()] == ["http://ok"]
+
+    def test_missing_file_is_empty(self):
+        assert cli._load_history() == []
+
+    def test_defaults_to_home_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(cli, "HISTORY_FILE", None)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        cli._save_to_history("GET", "http://a")
+        assert (tmp_path / ".reqcap_history.jsonl").exists()
+
+    def test_imports_legacy_json_history(self, monkeypatch, tmp_path):
+        history_file = tmp_path / ".reqcap_history.jsonl"
+        monkeypatch.setattr(cli, "HISTORY_FILE", history_file)
+        legacy = [{"method": "GET", "url": "http://new"}, {"method": "GET", "url": "http://old"}]
+        (tmp_path / ".reqcap_history.json").write_text(json.dumps(legacy, indent=2))
+        assert [e["url"] for e in cli._load_history()] == ["http://new", "http://old"]
+        cli._save_to_history("GET", "http://newest")
+        hist = cli._load_history()
+        assert [e["url"] for e in hist] == ["http://newest", "http://new", "http://old"]
+
+    def test_legacy_history_not_reimported(self, monkeypatch, tmp_path):
+        history_file = tmp_path / ".reqcap_history.jsonl"
+        monkeypatch.setattr(cli, "HISTORY_FILE", history_file)
+        (tmp_path / ".reqcap_history.json").write_text('[{"method": "GET", "url": "http://a"}]')
+        cli._save_to_history("GET", "http://b")
+        history_file.unlink()
+        assert cli._load_history() == []
+        assert (tmp_path / ".reqcap_history.json.migrated").exists()
+        assert not (tmp_path / ".reqcap_history.json").exists()
+
+    def test_compacts_when_large(self, monkeypatch):
+        monkeypatch.setattr(cli, "MAX_HISTORY", 2)
+        monkeypatch.setattr(cli, "HISTORY_COMPACT_BYTES", 200)
+        for i in range(10):
+            cli._save_to_history("GET", f"http://x/{i}")
+        lines = cli.HISTORY_FILE.read_text().splitlines()
+        assert len(lines) < 10
+        assert json.loads(lines[-1])["url"] == "http://x/9"
+
+
+# ── CLI integration ──────────────────────────────────────────────────────
+
+
+class TestHistoryCLI:
+    def test_empty_history(self, invoke_in, tmp_path):
+        result = invoke_in(["--history"])
+        assert "No request history." in result.output
+
+    def test_replay_newest(self, mock_exec, invoke_in, global_reqcap_dir):
+        mock_exec.return_value = make_request_result(body={"ok": True})
+        invoke_in(["GET", "http://localhost:3000/old"])
+        invoke_in(["GET", "http://localhost:3000/new"])
+
+        result = invoke_in(["--history"])
+        assert "[0] GET    http://localhost:3000/new" in result.output
+
+        invoke_in(["--replay", "0"])
+        _, kwargs = mock_exec.call_args
+        assert kwargs["url"] == "http://localhost:3000/new"
+
+    def test_replay_invalid_index(self, invoke_in, tmp_path, global_reqcap_dir):
+        result = invoke_in(["--replay", "3"])
+        assert result.exit_code == 1
+        assert "Invalid index 3" in result.output
@@ -4,100 +4,110 @@ import os
 
 import pytest
 
-from reqcap.cli import _detect_base_url, main
+from reqcap.cli import _detect_base_url
 
 
 @pytest.fixture
-def tmp_project(tmp_path):
-    original = os.getcwd()
-    os.chdir(tmp_path)
-    yield tmp_path
-    os.chdir(original)
+def tmp_project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
 # ── _detect_base_url ─────────────────────────────────────────────────────
 
 
-class TestDetectBaseUrl:
-    def test_node_project(self, tmp_project):
-        (tmp_project / "package.json").write_text("{}")
-        assert _detect_base_url() == "http://localhost:3000"
-
-    def test_python_pyproject(self, tmp_project):
-        (tmp_project / "pyproject.toml").write_text("[project]")
-        assert _detect_base_url() == "http://localhost:8000"
-
-    def test_python_requirements(self, tmp_project):
-        (tmp_project / "requirements.txt").write_text("flask")
-        assert _detect_base_url() == "http://localhost:8000"
+_MARKERS = {
+    "node": ("package.json", "{}"),
+    "python_pyproject": ("pyproject.toml", "[project]"),
+    "python_requirements": ("requirements.txt", "flask"),
+    "go": ("go.mod", "module example.com/myapp"),
+    "ruby": ("Gemfile", 'gem "rails"'),
+    "rust": ("Cargo.toml", "[package]"),
+}
 
-    def test_go_project(self, tmp_project):
-        (tmp_project / "go.mod").write_text("module example.com/myapp")
-        assert _detect_base_url() == "http://localhost:8080"
 
-    def test_ruby_project(self, tmp_project):
-        (tmp_project / "Gemfile").write_text('gem "rails"')
-        assert _detect_base_url() == "http://localhost:3000"
+@pytest.fixture(scope="class")
+def marker_tree(tmp_path_factory):
+    """One read-only project dir per framework marker, plus an empty one."""
+    base = tmp_path_factory.mktemp("markers")
+    for name, (filename, content) in _MARKERS.items():
+        (base / name).mkdir()
+        (base / name / filename).write_text(content)
+    (base / "empty").mkdir()
+    return base
 
-    def test_rust_project(self, tmp_project):
-        (tmp_project / "Cargo.toml").write_text("[package]")
-        assert _detect_base_url() == "http://localhost:8080"
 
-    def test_default_fallback(self, tmp_project):
-        assert _detect_base_url() == "http://localhost:3000"
+class TestDetectBaseUrl:
+    @pytest.mark.parametrize(
+        ("project", "expected"),
+        [
+            ("node", "http://localhost:3000"),
+            ("python_pyproject", "http://localhost:8000"),
+            ("python_requirements", "http://localhost:8000"),
+            ("go", "http://localhost:8080"),
+            ("ruby", "http://localhost:3000"),
+            ("rust", "http://localhost:8080"),
+            ("empty", "http://localhost:3000"),
+        ],
+        ids=[*_MARKERS, "default_fallback"],
+    )
+    def test_detected_url(self, marker_tree, monkeypatch, project, expected):
+        monkeypatch.chdir(marker_tree / project)
+        assert _detect_base_url() == expected
 
 
 # ── --init CLI ───────────────────────────────────────────────────────────
 
 
 class TestInitCLI:
-    def test_scaffolds_all(self, runner, tmp_project):
-        result = runner.invoke(main, ["--init"])
+    def test_scaffolds_all(self, invoke_in, tmp_project):
+        result = invoke_in(["--init"])
         assert result.exit_code == 0
-        assert (tmp_project / ".reqcap.yaml").exists()
-        assert (tmp_project / "templates").is_dir()
-        assert (tmp_project / "snapshots").is_dir()
+        entries = {e.name: e for e in os.scandir(tmp_project)}
+        assert entries[".reqcap.yaml"].is_file()
+        assert entries["templates"].is_dir()
+        assert entries["snapshots"].is_dir()
         assert "created" in result.output
 
-    def test_config_content(self, runner, tmp_project):
-        runner.invoke(main, ["--init"])
+    def test_config_content(self, invoke_in, tmp_project):
+        invoke_in(["--init"])
         content = (tmp_project / ".reqcap.yaml").read_text()
         assert "defaults:" in content
         assert "base_url:" in content
         assert "templates_dir:" in content
         assert "snapshots_dir:" in content
 
-    def test_detects_node(self, runner, tmp_project):
+    def test_detects_node(self, invoke_in, tmp_project):
         (tmp_project / "package.json").write_text("{}")
-        runner.invoke(main, ["--init"])
+        invoke_in(["--init"])
         content = (tmp_project / ".reqcap.yaml").read_text()
         assert "3000" in content
 
-    def test_detects_python(self, runner, tmp_project):
+    def test_detects_python(self, invoke_in, tmp_project):
         (tmp_project / "pyproject.toml").write_text("[project]")
-        runner.invoke(main, ["--init"])
+        invoke_in(["--init"])
         content = (tmp_project / ".reqcap.yaml").read_text()
         assert "8000" in content
 
-    def test_skip_existing_config(self, runner, tmp_project):
+    def test_skip_existing_config(self, invoke_in, tmp_project):
         (tmp_project / ".reqcap.yaml").write_text("existing: true")
-        runner.invoke(main, ["--init"])
+        invoke_in(["--init"])
         # Should not overwrite
         assert (tmp_project / ".reqcap.yaml").read_text() == "existing: true"
 
-    def test_skip_existing_dirs(self, runner, tmp_project):
+    def test_skip_existing_dirs(self, invoke_in, tmp_project):
         (tmp_project / "templates").mkdir()
         (tmp_project / "templates" / "keep.yaml").write_text("keep: true")
-        result = runner.invoke(main, ["--init"])
+        result = invoke_in(["--init"])
         assert result.exit_code == 0
         assert "skipped" in result.output
         # Original file preserved
         assert (tmp_project / "templates" / "keep.yaml").exists()
 
-    def test_idempotent(self, runner, tmp_project):
+    def test_idempotent(self, invoke_in, tmp_project):
         """Running init twice doesn't error or overwrite."""
-        result1 = runner.invoke(main, ["--init"])
+        result1 = invoke_in(["--init"])
         assert result1.exit_code == 0
-        result2 = runner.invoke(main, ["--init"])
+        result2 = invoke_in(["--init"])
         assert result2.exit_code == 0
         assert "skipped" in result2.output
@@ -1,56 +1,51 @@
 """Tests for --install-skill CLI option."""
 
 import os
+from pathlib import Path
 
-import pytest
-from click.testing import CliRunner
-
-from reqcap.cli import main
-
-
-@pytest.fixture
-def runner():
-    return CliRunner()
+from reqcap import cli
 
 
 class TestInstallSkill:
-    def test_claude_agent(self, runner, tmp_path):
-        os.chdir(tmp_path)
-        result = runner.invoke(main, ["--install-skill", "claude"])
+    def test_claude_agent(self, invoke_in, tmp_path):
+        result = invoke_in(["--install-skill", "claude"])
         assert result.exit_code == 0
         target = tmp_path / ".claude" / "skills" / "reqcap-skill"
-        assert (target / "SKILL.md").exists()
-        assert (target / "references" / "templates.md").exists()
+        assert "SKILL.md" in os.listdir(target)
+        assert "templates.md" in os.listdir(target / "references")
         assert "Installed reqcap skill to" in result.output
 
-    def test_cursor_agent(self, runner, tmp_path):
-        os.chdir(tmp_path)
-        result = runner.invoke(main, ["--install-skill", "cursor"])
+    def test_cursor_agent(self, invoke_in, tmp_path):
+        result = invoke_in(["--install-skill", "cursor"])
         assert result.exit_code == 0
         assert (tmp_path / ".cursor" / "skills" / "reqcap-skill" / "SKILL.md").exists()
 
-    def test_arbitrary_agent_name(self, runner, tmp_path):
+    def test_arbitrary_agent_name(self, invoke_in, tmp_path):
         """Any string works as agent name — not restricted to known agents."""
-        os.chdir(tmp_path)
-        result = runner.invoke(main, ["--install-skill", "blah"])
+        result = invoke_in(["--install-skill", "blah"])
         assert result.exit_code == 0
         target = tmp_path / ".blah" / "skills" / "reqcap-skill"
-        assert (target / "SKILL.md").exists()
-        assert (target / "references" / "templates.md").exists()
+        assert "SKILL.md" in os.listdir(target)
+        assert "templates.md" in os.listdir(target / "references")
 
-    def test_overwrites_cleanly(self, runner, tmp_path):
+    def test_overwrites_cleanly(self, invoke_in, tmp_path):
         """Re-running install overwrites existing files without error."""
-        os.chdir(tmp_path)
-        runner.invoke(main, ["--install-skill", "claude"])
-        result = runner.invoke(main, ["--install-skill", "claude"])
+        invoke_in(["--install-skill", "claude"])
+        result = invoke_in(["--install-skill", "claude"])
         assert result.exit_code == 0
         assert (tmp_path / ".claude" / "skills" / "reqcap-skill" / "SKILL.md").exists()
 
-    def test_skill_md_has_content(self, runner, tmp_path):
+    def test_skill_md_has_content(self, invoke_in, tmp_path):
         """Installed SKILL.md is not empty."""
-        os.chdir(tmp_path)
-        runner.invoke(main, ["--install-skill", "claude"])
+        invoke_in(["--install-skill", "claude"])
         skill_md = tmp_path / ".claude" / "skills" / "reqcap-skill" / "SKILL.md"
         content = skill_md.read_text()
         assert "reqcap" in content
         assert len(content) > 100
+
+    def test_installed_files_are_copies(self, invoke_in, tmp_path):
+        """Editing an installed file must not touch the package's skill_data."""
+        invoke_in(["--install-skill", "claude"])
+        installed = tmp_path / ".claude" / "skills" / "reqcap-skill" / "SKILL.md"
+        source = Path(cli.__file__).parent / "skill_data" / "SKILL.md"
+        assert not os.path.samefile(installed, source)
@@ -0,0 +1,43 @@
+"""Tests for parse_curl (--import-curl)."""
+
+from reqcap.core import parse_curl
+
+
+class TestParseCurl:
+    def test_get_url_only(self):
+        result = parse_curl("curl https://api.example.com/users")
+        assert result["method"] == "GET"
+        assert result["url"] == "https://api.example.com/users"
+        assert result["error"] is None
+
+    def test_method_and_headers(self):
+        result = parse_curl(
+            "curl -X delete -H 'Authorization: Bearer t' --header 'X-A:  b ' http://x/1"
+        )
+        assert result["method"] == "DELETE"
+        assert result["headers"] == {"Authorization": "Bearer t", "X-A": "b"}
+
+    def test_data_implies_post(self):
+        result = parse_curl("""curl http://x -d '{"a": 1}'""")
+        assert result["method"] == "POST"
+        assert result["body"] == '{"a": 1}'
+
+    def test_data_keeps_explicit_method(self):
+        assert parse_curl("curl -X PUT --data-raw x http://x")["method"] == "PUT"
+
+    def test_json_sets_content_headers(self):
+        result = parse_curl("curl --json '{}' -H 'Accept: text/plain' http://x")
+        assert result["method"] == "POST"
+        assert result["headers"] == {"Accept": "text/plain", "Content-Type": "application/json"}
+
+    def test_line_continuations_and_unknown_flags(self):
+        result = parse_curl("curl http://x/y \\\n  --compressed -s")
+        assert result["url"] == "http://x/y"
+
+    def test_trailing_flag_without_value(self):
+        result = parse_curl("curl http://x -X")
+        assert result["method"] == "GET"
+        assert result["url"] == "http://x"
+
+    def test_unbalanced_quote_is_error(self):
+        assert parse_curl("curl 'http://x")["error"].startswith("Parse error:")
@@ -0,0 +1,100 @@
+"""Tests for $VAR and {{...}} placeholder resolution."""
+
+import uuid
+
+from reqcap import core
+from reqcap.core import resolve_in_obj, resolve_placeholders, resolve_value
+
+# ── resolve_placeholders ─────────────────────────────────────────────────
+
+
+class TestResolvePlaceholders:
+    def test_extra_var(self):
+        assert resolve_placeholders("Bearer {{token}}", {}, {"token": "abc"}) == "Bearer abc"
+
+    def test_surrounding_whitespace_in_key(self):
+        assert resolve_placeholders("{{ token }}", {}, {"token": "abc"}) == "abc"
+
+    def test_multiple_placeholders(self):
+        result = resolve_placeholders("/users/{{id}}/posts/{{post}}", {}, {"id": 1, "post": 2})
+        assert result == "/users/1/posts/2"
+
+    def test_env_placeholder(self):
+        assert resolve_placeholders("{{env.API_KEY}}", {"API_KEY": "k"}) == "k"
+
+    def test_unknown_placeholder_left_intact(self):
+        assert resolve_placeholders("x={{missing}}", {}, {}) == "x={{missing}}"
+
+    def test_uuid_is_fresh_per_call(self):
+        first = resolve_placeholders("{{uuid}}", {})
+        second = resolve_placeholders("{{uuid}}", {})
+        assert uuid.UUID(first)
+        assert first != second
+
+    def test_timestamp_is_numeric(self):
+        assert resolve_placeholders("{{timestamp}}", {}).isdigit()
+
+    def test_timestamp_ms_is_numeric(self):
+        assert len(resolve_placeholders("{{timestamp_ms}}", {})) >= 13
+
+    def test_date_is_iso_utc(self):
+        assert resolve_placeholders("{{date}}", {}).endswith("+00:00")
+
+    def test_builtin_beats_extra_var_of_same_name(self):
+        assert resolve_placeholders("{{uuidv4}}", {}, {"uuidv4": "fixed"}) != "fixed"
+
+    def test_no_placeholders_unchanged(self):
+        assert resolve_placeholders("application/json", {}) == "application/json"
+
+    def test_non_string_passthrough(self):
+        assert resolve_placeholders(42, {}) == 42
+
+
+# ── resolve_value ────────────────────────────────────────────────────────
+
+
+class TestResolveValue:
+    def test_dollar_var(self):
+        assert resolve_value("$HOST", {"HOST": "api"}) == "api"
+
+    def test_braced_var(self):
+        assert resolve_value("http://${HOST}:3000", {"HOST": "api"}) == "http://api:3000"
+
+    def test_unknown_var_left_intact(self):
+        assert resolve_value("$REQCAP_TEST_UNSET_VAR", {}) == "$REQCAP_TEST_UNSET_VAR"
+
+    def test_none(self):
+        assert resolve_value(None, {}) is None
+
+    def test_env_dict_is_the_only_source(self, monkeypatch):
+        """load_env snapshots os.environ; resolvers don't consult it again."""
+        monkeypatch.setenv("REQCAP_TEST_LATE_VAR", "late")
+        assert resolve_value("$REQCAP_TEST_LATE_VAR", {}) == "$REQCAP_TEST_LATE_VAR"
+        assert resolve_placeholders("{{env.REQCAP_TEST_LATE_VAR}}", {}) == (
+            "{{env.REQCAP_TEST_LATE_VAR}}"
+        )
+        env = core.load_env(None)
+        assert resolve_value("$REQCAP_TEST_LATE_VAR", env) == "late"
+
+
+# ── resolve_in_obj ───────────────────────────────────────────────────────
+
+
+class TestResolveInObj:
+    def test_nested_structures(self):
+        obj = {"user": {"name": "{{name}}", "tags": ["$TAG", 1]}}
+        result = resolve_in_obj(obj, {"TAG": "admin"}, {"name": "alice"})
+        assert result == {"user": {"name": "alice", "tags": ["admin", 1]}}
+
+    def test_in_place_variant_matches(self):
+        obj = {"user": {"name": "{{name}}", "tags": ["$TAG", 1, ["{{name}}"]]}, "n": None}
+        expected = resolve_in_obj(obj, {"TAG": "admin"}, {"name": "alice"})
+        inner = obj["user"]
+
+        result = core._resolve_in_place(obj, {"TAG": "admin"}, {"name": "alice"})
+        assert result is obj
+        assert obj["user"] is inner
+        assert obj == expected
+
+    def test_in_place_scalar_root(self):
+        assert core._resolve_in_place("{{x}}", {}, {"x": "1"}) == "1"
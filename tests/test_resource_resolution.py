@@ -1,31 +1,15 @@
 """Tests for generic resolve_resource_dir."""
 
-import os
-
 import pytest
 
 from reqcap import core
 
 
 @pytest.fixture
-def tmp_project(tmp_path):
+def tmp_project(tmp_path, monkeypatch):
     """Create a temporary project directory and cd into it."""
-    original = os.getcwd()
-    os.chdir(tmp_path)
-    yield tmp_path
-    os.chdir(original)
-
-
-@pytest.fixture
-def global_reqcap_dir(tmp_path, monkeypatch):
-    """Override the global ~/.reqcap directory to a temp location."""
-    fake_global = tmp_path / "fake_home" / ".reqcap"
-    fake_global.mkdir(parents=True)
-    monkeypatch.setattr(core, "GLOBAL_DIR", fake_global)
-    monkeypatch.setattr(core, "GLOBAL_CONFIG", fake_global / "config.yaml")
-    monkeypatch.setattr(core, "GLOBAL_TEMPLATES_DIR", fake_global / "templates")
-    monkeypatch.setattr(core, "GLOBAL_SNAPSHOTS_DIR", fake_global / "snapshots")
-    return fake_global
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
 def _make_config(config_dir=None, **extra_defaults):
@@ -154,6 +138,25 @@ class TestResolveResourceDir:
         result = core.resolve_templates_dir(None, config)
         assert result == tdir.resolve()
 
+    def test_missing_dir_found_once_created(self, tmp_project, global_reqcap_dir):
+        """A miss is not cached, so a directory created mid-run is picked up."""
+        config = _make_config()
+        assert core.resolve_resource_dir("snapshots", None, config) is None
+        (tmp_project / "snapshots").mkdir()
+        result = core.resolve_resource_dir("snapshots", None, config)
+        assert result == (tmp_project / "snapshots").resolve()
+
+    def test_cwd_dir_created_later_beats_global(self, tmp_project, global_reqcap_dir):
+        """Every lookup probes in order, so a new ./snapshots overrides the global dir."""
+        (global_reqcap_dir / "snapshots").mkdir()
+        config = _make_config()
+        assert core.resolve_resource_dir("snapshots", None, config) == (
+            (global_reqcap_dir / "snapshots").resolve()
+        )
+        (tmp_project / "snapshots").mkdir()
+        result = core.resolve_resource_dir("snapshots", None, config)
+        assert result == (tmp_project / "snapshots").resolve()
+
 
 class TestResourceSearchPaths:
     def test_with_resolved_dir(self, tmp_project):
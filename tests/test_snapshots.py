@@ -1,8 +1,6 @@
 """Tests for snapshot save/load/diff/list + CLI integration."""
 
 import json
-import os
-from unittest.mock import patch
 
 import pytest
 
@@ -12,22 +10,9 @@ from tests.conftest import make_request_result
 
 
 @pytest.fixture
-def tmp_project(tmp_path):
-    original = os.getcwd()
-    os.chdir(tmp_path)
-    yield tmp_path
-    os.chdir(original)
-
-
-@pytest.fixture
-def global_reqcap_dir(tmp_path, monkeypatch):
-    fake_global = tmp_path / "fake_home" / ".reqcap"
-    fake_global.mkdir(parents=True)
-    monkeypatch.setattr(core, "GLOBAL_DIR", fake_global)
-    monkeypatch.setattr(core, "GLOBAL_CONFIG", fake_global / "config.yaml")
-    monkeypatch.setattr(core, "GLOBAL_TEMPLATES_DIR", fake_global / "templates")
-    monkeypatch.setattr(core, "GLOBAL_SNAPSHOTS_DIR", fake_global / "snapshots")
-    return fake_global
+def tmp_project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
 # ── Unit tests: save/load/diff/list ──────────────────────────────────────
@@ -140,6 +125,31 @@ class TestDiffSnapshot:
         diffs = core.diff_snapshot(snapshot, result)
         assert any("b" in d for d in diffs)
 
+    def test_identical_nested_body(self):
+        body = {"items": [{"id": i, "tags": ["a", "b"]} for i in range(100)], "meta": {"n": 100}}
+        snapshot = {"status_code": 200, "body": json.loads(json.dumps(body))}
+        result = make_request_result(status_code=200, body=body)
+        assert core.diff_snapshot(snapshot, result) == []
+
+    def test_status_diff_with_identical_body(self):
+        snapshot = {"status_code": 200, "body": {"a": 1}}
+        result = make_request_result(status_code=201, body={"a": 1})
+        assert core.diff_snapshot(snapshot, result) == ["status_code: 200 → 201"]
+
+    def test_nested_diff_lines_sorted_by_key(self):
+        snapshot = {
+            "status_code": 200,
+            "body": {"z": 1, "same": {"k": [1]}, "a": {"y": 1, "x": 1}},
+        }
+        result = make_request_result(
+            status_code=200, body={"a": {"x": 2, "w": 0}, "same": {"k": [1]}, "z": 1}
+        )
+        assert core.diff_snapshot(snapshot, result) == [
+            "body.a.w: (absent) → 0",
+            "body.a.x: 1 → 2",
+            "body.a.y: 1 → (absent)",
+        ]
+
     def test_non_dict_body_diff(self):
         snapshot = {"status_code": 200, "body": "hello"}
         result = make_request_result(status_code=200, body="world")
@@ -170,6 +180,24 @@ class TestListSnapshots:
         assert "alpha" in names
         assert "beta" in names
 
+    def test_reads_saved_at_from_head(self, tmp_project, global_reqcap_dir):
+        snaps_dir = tmp_project / "snapshots"
+        core.save_snapshot("big", make_request_result(body={"x": "y" * 10_000}), snaps_dir)
+        data = json.loads((snaps_dir / "big.json").read_text())
+        assert next(iter(data)) == "saved_at"
+
+        config = {"defaults": {}, "_config_dir": None}
+        _, snapshots = core.list_snapshots(config)
+        assert snapshots == [{"name": "big", "saved_at": data["saved_at"]}]
+
+    def test_unreadable_file_marked(self, tmp_project, global_reqcap_dir):
+        snaps_dir = tmp_project / "snapshots"
+        snaps_dir.mkdir()
+        (snaps_dir / "broken.json").write_text("not json")
+        config = {"defaults": {}, "_config_dir": None}
+        _, snapshots = core.list_snapshots(config)
+        assert snapshots == [{"name": "broken", "saved_at": "?"}]
+
     def test_empty_dir(self, tmp_project, global_reqcap_dir):
         (tmp_project / "snapshots").mkdir()
         config = {"defaults": {}, "_config_dir": None}
@@ -188,7 +216,6 @@ class TestListSnapshots:
 
 
 class TestSnapshotCLI:
-    @patch("reqcap.executor.execute_request")
     def test_save_creates_snapshot(self, mock_exec, runner, tmp_project, global_reqcap_dir):
         mock_exec.return_value = make_request_result(
             status_code=200,
@@ -208,7 +235,6 @@ class TestSnapshotCLI:
         snap_file = tmp_project / "snapshots" / "users_baseline.json"
         assert snap_file.exists()
 
-    @patch("reqcap.executor.execute_request")
     def test_diff_no_differences(self, mock_exec, runner, tmp_project, global_reqcap_dir):
         # First save
         mock_exec.return_value = make_request_result(
@@ -229,7 +255,6 @@ class TestSnapshotCLI:
         assert result.exit_code == 0
         assert "No differences" in result.output
 
-    @patch("reqcap.executor.execute_request")
     def test_diff_with_differences_exits_1(
         self, mock_exec, runner, tmp_project, global_reqcap_dir
     ):
@@ -250,7 +275,6 @@ class TestSnapshotCLI:
         assert result.exit_code == 1
         assert "Differences found" in result.output
 
-    @patch("reqcap.executor.execute_request")
     def test_diff_missing_snapshot_exits_1(
         self, mock_exec, runner, tmp_project, global_reqcap_dir
     ):
@@ -267,7 +291,6 @@ class TestSnapshotCLI:
         assert result.exit_code == 1
         assert "not found" in result.output
 
-    @patch("reqcap.executor.execute_request")
     def test_list_snapshots(self, mock_exec, runner, tmp_project, global_reqcap_dir):
         # Create a snapshot first
         mock_exec.return_value = make_request_result(body={"ok": True})
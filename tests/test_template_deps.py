@@ -1,37 +1,33 @@
 """Tests for template dependency chaining (depends: key)."""
 
-import os
-from unittest.mock import patch
+import threading
+import time
+from unittest.mock import Mock
 
-import yaml
+from reqcap import cli, executor
+from tests.conftest import dump_yaml, make_request_result, write_file
 
-from reqcap.cli import main
-from tests.conftest import make_request_result
 
-
-def _write_config(path, base_url=None, templates_dir=None):
+def _write_config(path, base_url=None, templates_dir=None, **extra_defaults):
     defaults = {}
     if base_url:
         defaults["base_url"] = base_url
     if templates_dir is not None:
         defaults["templates_dir"] = templates_dir
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.dump({"defaults": defaults}))
+    defaults.update(extra_defaults)
+    write_file(path, dump_yaml({"defaults": defaults}))
 
 
 def _write_template(path, **fields):
     tpl = {"method": "GET", "url": "/health"}
     tpl.update(fields)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.dump(tpl))
+    write_file(path, dump_yaml(tpl))
 
 
 class TestSingleDependency:
     """A depends on B, B's exports available in A."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_dep_exports_flow_to_parent(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_dep_exports_flow_to_parent(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         tpl_dir = tmp_path / "templates"
 
@@ -68,7 +64,7 @@ class TestSingleDependency:
             ),
         ]
 
-        result = runner.invoke(main, ["-t", "get-users"])
+        result = invoke_in(["-t", "get-users"])
         assert result.exit_code == 0
 
         # Dep status line printed
@@ -85,9 +81,7 @@ class TestSingleDependency:
 class TestMultipleDependencies:
     """A depends on [B, C], both run in order."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_multiple_deps_run_in_order(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_multiple_deps_run_in_order(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         tpl_dir = tmp_path / "templates"
 
@@ -123,7 +117,7 @@ class TestMultipleDependencies:
             make_request_result(body={"dashboard": "data"}, elapsed_ms=30),
         ]
 
-        result = runner.invoke(main, ["-t", "dashboard"])
+        result = invoke_in(["-t", "dashboard"])
         assert result.exit_code == 0
         assert "[dep: get-csrf] STATUS: 200" in result.output
         assert "[dep: login] STATUS: 200" in result.output
@@ -137,9 +131,7 @@ class TestMultipleDependencies:
 class TestNestedDependencies:
     """A → B → C, depth-first execution, exports accumulate."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_nested_depth_first(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_nested_depth_first(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         tpl_dir = tmp_path / "templates"
 
@@ -178,7 +170,7 @@ class TestNestedDependencies:
             make_request_result(body={"items": []}, elapsed_ms=25),
         ]
 
-        result = runner.invoke(main, ["-t", "fetch-data"])
+        result = invoke_in(["-t", "fetch-data"])
         assert result.exit_code == 0
 
         # Execution order: get-config → login → fetch-data
@@ -192,9 +184,7 @@ class TestNestedDependencies:
 class TestCycleDetection:
     """A → B → A errors with clear message."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_direct_cycle(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_direct_cycle(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         tpl_dir = tmp_path / "templates"
 
@@ -213,13 +203,11 @@ class TestCycleDetection:
             depends=["a"],
         )
 
-        result = runner.invoke(main, ["-t", "a"])
+        result = invoke_in(["-t", "a"])
         assert result.exit_code == 1
         assert "Circular dependency" in result.output
 
-    @patch("reqcap.executor.execute_request")
-    def test_self_cycle(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_self_cycle(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         tpl_dir = tmp_path / "templates"
 
@@ -231,7 +219,7 @@ class TestCycleDetection:
             depends=["self"],
         )
 
-        result = runner.invoke(main, ["-t", "self"])
+        result = invoke_in(["-t", "self"])
         assert result.exit_code == 1
         assert "Circular dependency" in result.output
 
@@ -239,8 +227,7 @@ class TestCycleDetection:
 class TestDepLoadFailure:
     """Depends on nonexistent template → error."""
 
-    def test_missing_dep_template(self, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_missing_dep_template(self, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         tpl_dir = tmp_path / "templates"
 
@@ -252,7 +239,7 @@ class TestDepLoadFailure:
             depends=["nonexistent"],
         )
 
-        result = runner.invoke(main, ["-t", "main"])
+        result = invoke_in(["-t", "main"])
         assert result.exit_code == 1
         assert "nonexistent" in result.output
         assert "not found" in result.output
@@ -261,9 +248,7 @@ class TestDepLoadFailure:
 class TestDepRequestFailure:
     """Dep returns connection error → abort."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_dep_error_aborts(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_dep_error_aborts(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         tpl_dir = tmp_path / "templates"
 
@@ -284,7 +269,7 @@ class TestDepRequestFailure:
 
         mock_exec.return_value = make_request_result(error="Connection error: refused")
 
-        result = runner.invoke(main, ["-t", "protected"])
+        result = invoke_in(["-t", "protected"])
         assert result.exit_code == 1
         assert "login" in result.output
         assert "Connection error" in result.output
@@ -293,9 +278,7 @@ class TestDepRequestFailure:
 class TestVariableOverride:
     """-v token=manual overrides dep export of token."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_cli_var_overrides_dep_export(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_cli_var_overrides_dep_export(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         tpl_dir = tmp_path / "templates"
 
@@ -321,7 +304,7 @@ class TestVariableOverride:
         ]
 
         # -v token=manual should override the dep export
-        result = runner.invoke(main, ["-t", "api", "-v", "token=manual"])
+        result = invoke_in(["-t", "api", "-v", "token=manual"])
         assert result.exit_code == 0
 
         # The dep still runs but its export of `token` is skipped
@@ -333,9 +316,7 @@ class TestVariableOverride:
 class TestNoDependsKey:
     """Existing templates without depends work unchanged."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_no_depends_works_normally(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_no_depends_works_normally(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         tpl_dir = tmp_path / "templates"
 
@@ -348,7 +329,7 @@ class TestNoDependsKey:
 
         mock_exec.return_value = make_request_result(body={"status": "ok"})
 
-        result = runner.invoke(main, ["-t", "simple"])
+        result = invoke_in(["-t", "simple"])
         assert result.exit_code == 0
         assert "STATUS: 200" in result.output
         # No dep lines
@@ -358,9 +339,7 @@ class TestNoDependsKey:
 class TestStringDepends:
     """depends: can be a single string instead of a list."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_string_depends(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_string_depends(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         tpl_dir = tmp_path / "templates"
 
@@ -384,6 +363,151 @@ class TestStringDepends:
             make_request_result(body={"ok": True}, elapsed_ms=20),
         ]
 
-        result = runner.invoke(main, ["-t", "consumer"])
+        result = invoke_in(["-t", "consumer"])
         assert result.exit_code == 0
         assert "[dep: dep] STATUS: 200" in result.output
+
+
+class TestSharedDependency:
+    """A → [B, C], B → D, C → D: D is loaded and executed once."""
+
+    def test_diamond_runs_shared_dep_once(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
+        _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
+        tpl_dir = tmp_path / "templates"
+
+        _write_template(tpl_dir / "d.yaml", name="d", url="/d", exports={"token": "body.t"})
+        _write_template(tpl_dir / "b.yaml", name="b", url="/b", depends=["d"])
+        _write_template(tpl_dir / "c.yaml", name="c", url="/c", depends=["d"])
+        _write_template(
+            tpl_dir / "a.yaml",
+            name="a",
+            url="/a",
+            depends=["b", "c"],
+            headers={"Authorization": "Bearer {{token}}"},
+        )
+
+        mock_exec.return_value = make_request_result(body={"t": "shared"})
+
+        result = invoke_in(["-t", "a"])
+        assert result.exit_code == 0
+
+        urls = [kwargs["url"] for _, kwargs in mock_exec.call_args_list]
+        assert urls == [
+            "http://api:3000/d",
+            "http://api:3000/b",
+            "http://api:3000/c",
+            "http://api:3000/a",
+        ]
+        assert result.output.count("[dep: d]") == 1
+        _, kwargs = mock_exec.call_args_list[-1]
+        assert kwargs["headers"]["Authorization"] == "Bearer shared"
+
+
+class TestIndirectCycle:
+    """A → B → C → A reports the full chain."""
+
+    def test_cycle_path_in_message(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
+        _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
+        tpl_dir = tmp_path / "templates"
+
+        _write_template(tpl_dir / "a.yaml", name="a", url="/a", depends=["b"])
+        _write_template(tpl_dir / "b.yaml", name="b", url="/b", depends=["c"])
+        _write_template(tpl_dir / "c.yaml", name="c", url="/c", depends=["a"])
+
+        result = invoke_in(["-t", "a"])
+        assert result.exit_code == 1
+        assert "Circular dependency detected: a → b → c → a" in result.output
+        mock_exec.assert_not_called()
+
+
+class TestParallelDeps:
+    """defaults.parallel_deps runs independent siblings concurrently."""
+
+    def _setup(self, tmp_path, login_headers=None):
+        _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000", parallel_deps=True)
+        tpl_dir = tmp_path / "templates"
+        _write_template(
+            tpl_dir / "csrf.yaml", name="csrf", url="/csrf", exports={"csrf": "body.v"}
+        )
+        _write_template(
+            tpl_dir / "login.yaml",
+            name="login",
+            url="/login",
+            exports={"token": "body.v"},
+            headers=login_headers or {},
+        )
+        _write_template(
+            tpl_dir / "dash.yaml",
+            name="dash",
+            url="/dash",
+            depends=["csrf", "login"],
+            headers={"X-CSRF": "{{csrf}}", "Authorization": "Bearer {{token}}"},
+        )
+
+    def test_independent_siblings_overlap(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
+        self._setup(tmp_path)
+        # Both deps must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake(url, **kwargs):
+            if not url.endswith("/dash"):
+                barrier.wait()
+            return make_request_result(body={"v": url.rsplit("/", 1)[-1]})
+
+        mock_exec.side_effect = fake
+        result = invoke_in(["-t", "dash"])
+        assert result.exit_code == 0, result.output
+        assert result.output.index("[dep: csrf]") < result.output.index("[dep: login]")
+        _, kwargs = mock_exec.call_args_list[-1]
+        assert kwargs["headers"]["X-CSRF"] == "csrf"
+        assert kwargs["headers"]["Authorization"] == "Bearer login"
+
+    def test_sibling_using_export_waits(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
+        self._setup(tmp_path, login_headers={"X-CSRF": "{{csrf}}"})
+
+        def fake(url, **kwargs):
+            return make_request_result(body={"v": url.rsplit("/", 1)[-1]})
+
+        mock_exec.side_effect = fake
+        result = invoke_in(["-t", "dash"])
+        assert result.exit_code == 0
+        urls = [kwargs["url"] for _, kwargs in mock_exec.call_args_list]
+        assert urls == ["http://api:3000/csrf", "http://api:3000/login", "http://api:3000/dash"]
+        _, login_kwargs = mock_exec.call_args_list[1]
+        assert login_kwargs["headers"]["X-CSRF"] == "csrf"
+
+    def test_failing_dep_waits_for_slow_sibling(
+        self, mock_exec, invoke_in, tmp_path, global_reqcap_dir
+    ):
+        """A dep that fails fast exits only after its in-flight sibling finishes."""
+        self._setup(tmp_path)
+        finished = []
+
+        def fake(url, **kwargs):
+            if url.endswith("/csrf"):
+                return make_request_result(error="Connection error: refused")
+            time.sleep(0.2)
+            finished.append(url)
+            return make_request_result(body={"v": "login"})
+
+        mock_exec.side_effect = fake
+        result = invoke_in(["-t", "dash"])
+        assert result.exit_code == 1
+        assert "Dependency 'csrf' failed: Connection error: refused" in result.output
+        assert finished == ["http://api:3000/login"]
+        urls = [kwargs["url"] for _, kwargs in mock_exec.call_args_list]
+        assert "http://api:3000/dash" not in urls
+
+    def test_worker_sessions_closed(self, monkeypatch):
+        made = []
+
+        def fake_session():
+            made.append(Mock())
+            return made[-1]
+
+        monkeypatch.setattr(executor, "_make_session", fake_session)
+        reqs = [{"method": "GET", "url": f"http://api:3000/{i}"} for i in range(2)]
+        results = cli._execute_batch(lambda **kw: make_request_result(), reqs, None)
+        assert len(results) == 2
+        assert made
+        assert all(s.close.called for s in made)
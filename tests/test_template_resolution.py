@@ -1,44 +1,31 @@
 """Tests for template directory and template file resolution."""
 
-import os
+import json
 
 import pytest
-import yaml
 
 from reqcap import core
+from tests.conftest import dump_yaml, write_file
 
 
 @pytest.fixture
-def tmp_project(tmp_path):
+def tmp_project(tmp_path, monkeypatch):
     """Create a temporary project directory and cd into it."""
-    original = os.getcwd()
-    os.chdir(tmp_path)
-    yield tmp_path
-    os.chdir(original)
-
-
-@pytest.fixture
-def global_reqcap_dir(tmp_path, monkeypatch):
-    """Override the global ~/.reqcap directory to a temp location."""
-    fake_global = tmp_path / "fake_home" / ".reqcap"
-    fake_global.mkdir(parents=True)
-    monkeypatch.setattr(core, "GLOBAL_DIR", fake_global)
-    monkeypatch.setattr(core, "GLOBAL_CONFIG", fake_global / "config.yaml")
-    monkeypatch.setattr(core, "GLOBAL_TEMPLATES_DIR", fake_global / "templates")
-    return fake_global
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
 def _write_template(path, url="/health", method="GET", description="test"):
     """Helper to write a template YAML file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        yaml.dump(
+    write_file(
+        path,
+        dump_yaml(
             {
                 "url": url,
                 "method": method,
                 "description": description,
             }
-        )
+        ),
     )
 
 
@@ -274,6 +261,40 @@ class TestLoadTemplate:
         assert result is not None
         assert result["url"] == "/deep"
 
+    def test_utf8_template_read_regardless_of_locale(self, tmp_project):
+        tpl = tmp_project / "unicode.yaml"
+        tpl.write_bytes("url: /café\ndescription: naïve — ok\n".encode())
+        result = core.load_template(str(tpl), _make_config())
+        assert result["url"] == "/café"
+        assert result["description"] == "naïve — ok"
+
+    def test_optional_keys_normalized(self, tmp_project):
+        """Shorthand and null optional keys load in their canonical shapes."""
+        tpl = tmp_project / "short.yaml"
+        tpl.write_text(
+            "url: /x\n"
+            "depends: login\n"
+            "fields: [email, {name: pw, path: auth.pw}]\n"
+            "exports:\n"
+            "snapshot: true\n"
+            "filter:\n"
+        )
+        result = core.load_template(str(tpl), _make_config())
+        assert result["depends"] == ["login"]
+        assert result["fields"] == [{"name": "email"}, {"name": "pw", "path": "auth.pw"}]
+        assert result["exports"] == {}
+        assert result["snapshot"] == {"enabled": True}
+        assert "filter" not in result
+
+    def test_missing_optional_keys_defaulted(self, tmp_project):
+        tpl = tmp_project / "bare.yaml"
+        _write_template(tpl)
+        result = core.load_template(str(tpl), _make_config())
+        assert result["depends"] == []
+        assert result["fields"] == []
+        assert result["exports"] == {}
+        assert result["snapshot"] == {}
+
 
 # ── list_templates ───────────────────────────────────────────────────────
 
@@ -321,6 +342,13 @@ class TestListTemplates:
         assert len(templates) == 1
         assert templates[0]["name"] == "valid"
 
+    def test_ignores_yaml_named_subdirectories(self, tmp_project):
+        tpl_dir = tmp_project / "templates"
+        _write_template(tpl_dir / "valid.yml", url="/valid")
+        (tpl_dir / "nested.yaml").mkdir()
+        _, templates = core.list_templates(_make_config())
+        assert [t["name"] for t in templates] == ["valid"]
+
     def test_override_dir(self, tmp_project):
         """templates_dir_override is used for listing."""
         override = tmp_project / "custom"
@@ -393,3 +421,77 @@ class TestTemplateSearchPaths:
 
         paths = core.template_search_paths("mytemplate", config)
         assert str(config_dir / "tpl" / "mytemplate.yaml") in paths
+
+
+# ── build_request_from_template ──────────────────────────────────────────
+
+
+class TestBuildRequestBody:
+    def _template(self):
+        return {
+            "url": "/login",
+            "method": "POST",
+            "body": {"auth": {"email": "", "password": ""}, "note": "{{note}}"},
+            "fields": [{"name": "email", "path": "auth.email"}, {"name": "password"}],
+        }
+
+    def test_fields_and_placeholders_applied(self):
+        tpl = self._template()
+        req = core.build_request_from_template(
+            _make_config(), tpl, {"email": "a@b.c", "note": "hi"}, {}
+        )
+        assert json.loads(req["body"]) == {
+            "auth": {"email": "a@b.c", "password": ""},
+            "note": "hi",
+        }
+
+    def test_template_body_not_mutated(self):
+        tpl = self._template()
+        core.build_request_from_template(_make_config(), tpl, {"email": "a@b.c", "note": "x"}, {})
+        core.build_request_from_template(_make_config(), tpl, {"note": "y"}, {})
+        assert tpl["body"] == self._template()["body"]
+
+
+class TestBuildRequestHeaders:
+    def test_template_headers_override_defaults(self):
+        config = _make_config()
+        config["defaults"]["headers"] = {"Accept": "text/plain", "X-Env": "$STAGE"}
+        tpl = {"url": "/x", "headers": {"Accept": "application/json", "X-Id": "{{id}}"}}
+        req = core.build_request_from_template(config, tpl, {"id": "7"}, {"STAGE": "dev"})
+        assert req["headers"] == {"Accept": "application/json", "X-Env": "dev", "X-Id": "7"}
+        assert config["defaults"]["headers"] == {"Accept": "text/plain", "X-Env": "$STAGE"}
+
+
+class TestBuildRequestAuth:
+    def test_auth_overrides_template_header(self):
+        tpl = {"url": "/x", "headers": {"Authorization": "old"}, "auth": {"type": "bearer"}}
+        tpl["auth"]["token"] = "{{token}}"
+        req = core.build_request_from_template(_make_config(), tpl, {"token": "t1"}, {})
+        assert req["headers"] == {"Authorization": "Bearer t1"}
+
+    def test_exported_token_not_env_expanded(self):
+        """A variable value containing '$' is used verbatim, not re-resolved."""
+        tpl = {"url": "/x", "auth": {"type": "bearer", "token": "{{token}}"}}
+        req = core.build_request_from_template(
+            _make_config(), tpl, {"token": "a$HOME"}, {"HOME": "/root"}
+        )
+        assert req["headers"]["Authorization"] == "Bearer a$HOME"
+
+
+class TestSetAtPath:
+    def test_top_level_key(self):
+        obj = {"a": 1}
+        core.set_at_path(obj, "b", "x")
+        assert obj == {"a": 1, "b": "x"}
+
+    def test_nested_creates_containers(self):
+        obj = {}
+        core.set_at_path(obj, "messages[1].content", "hi")
+        assert obj == {"messages": [{}, {"content": "hi"}]}
+
+    def test_repeated_path_reuses_tokens(self):
+        first, second = {}, {}
+        core.set_at_path(first, "user.name", "a")
+        core.set_at_path(second, "user.name", "b")
+        assert first == {"user": {"name": "a"}}
+        assert second == {"user": {"name": "b"}}
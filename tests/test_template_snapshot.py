@@ -1,13 +1,8 @@
 """Tests for template auto-snapshot (snapshot: key)."""
 
 import json
-import os
-from unittest.mock import patch
 
-import yaml
-
-from reqcap.cli import main
-from tests.conftest import make_request_result
+from tests.conftest import dump_yaml, make_request_result, write_file
 
 
 def _write_config(path, base_url=None, snapshots_dir=None):
@@ -16,23 +11,19 @@ def _write_config(path, base_url=None, snapshots_dir=None):
         defaults["base_url"] = base_url
     if snapshots_dir is not None:
         defaults["snapshots_dir"] = snapshots_dir
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.dump({"defaults": defaults}))
+    write_file(path, dump_yaml({"defaults": defaults}))
 
 
 def _write_template(path, **fields):
     tpl = {"method": "GET", "url": "/health"}
     tpl.update(fields)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.dump(tpl))
+    write_file(path, dump_yaml(tpl))
 
 
 class TestAutoSnapshotEnabled:
     """snapshot.enabled: true auto-saves a snapshot."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_creates_snapshot_file(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_creates_snapshot_file(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         snap_dir = tmp_path / "snapshots"
         snap_dir.mkdir()
@@ -48,7 +39,7 @@ class TestAutoSnapshotEnabled:
 
         mock_exec.return_value = make_request_result(body={"status": "ok"}, elapsed_ms=15)
 
-        result = runner.invoke(main, ["-t", "health"])
+        result = invoke_in(["-t", "health"])
         assert result.exit_code == 0
 
         # Snapshot file should exist named after template
@@ -65,9 +56,7 @@ class TestAutoSnapshotEnabled:
 class TestAutoSnapshotCustomName:
     """snapshot.name overrides the template name for the snapshot file."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_uses_custom_name(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_uses_custom_name(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         snap_dir = tmp_path / "snapshots"
         snap_dir.mkdir()
@@ -83,7 +72,7 @@ class TestAutoSnapshotCustomName:
 
         mock_exec.return_value = make_request_result(body={"ok": True})
 
-        result = runner.invoke(main, ["-t", "health"])
+        result = invoke_in(["-t", "health"])
         assert result.exit_code == 0
 
         # Custom name used for snapshot file
@@ -95,9 +84,7 @@ class TestAutoSnapshotCustomName:
 class TestAutoSnapshotDisabled:
     """snapshot.enabled: false does not save a snapshot."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_no_snapshot_when_disabled(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_no_snapshot_when_disabled(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         snap_dir = tmp_path / "snapshots"
         snap_dir.mkdir()
@@ -113,7 +100,7 @@ class TestAutoSnapshotDisabled:
 
         mock_exec.return_value = make_request_result(body={"ok": True})
 
-        result = runner.invoke(main, ["-t", "health"])
+        result = invoke_in(["-t", "health"])
         assert result.exit_code == 0
         assert not (snap_dir / "health.json").exists()
         assert "Snapshot saved" not in result.output
@@ -122,9 +109,7 @@ class TestAutoSnapshotDisabled:
 class TestAutoSnapshotNoKey:
     """Templates without snapshot key work unchanged."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_no_snapshot_without_key(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_no_snapshot_without_key(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         snap_dir = tmp_path / "snapshots"
         snap_dir.mkdir()
@@ -139,7 +124,7 @@ class TestAutoSnapshotNoKey:
 
         mock_exec.return_value = make_request_result(body={"ok": True})
 
-        result = runner.invoke(main, ["-t", "health"])
+        result = invoke_in(["-t", "health"])
         assert result.exit_code == 0
         assert not (snap_dir / "health.json").exists()
 
@@ -147,9 +132,7 @@ class TestAutoSnapshotNoKey:
 class TestAutoSnapshotCreatesDir:
     """Auto-snapshot creates the snapshots directory if it doesn't exist."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_creates_snapshots_dir(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_creates_snapshots_dir(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         # Do NOT create snapshots/ dir — auto-snapshot should create it
         tpl_dir = tmp_path / "templates"
@@ -164,7 +147,7 @@ class TestAutoSnapshotCreatesDir:
 
         mock_exec.return_value = make_request_result(body={"ok": True})
 
-        result = runner.invoke(main, ["-t", "health"])
+        result = invoke_in(["-t", "health"])
         assert result.exit_code == 0
 
         snap_dir = tmp_path / "snapshots"
@@ -175,9 +158,7 @@ class TestAutoSnapshotCreatesDir:
 class TestAutoSnapshotWithManualSnapshot:
     """--snapshot and snapshot: both work together."""
 
-    @patch("reqcap.executor.execute_request")
-    def test_both_snapshots_saved(self, mock_exec, runner, tmp_path, global_reqcap_dir):
-        os.chdir(tmp_path)
+    def test_both_snapshots_saved(self, mock_exec, invoke_in, tmp_path, global_reqcap_dir):
         _write_config(tmp_path / ".reqcap.yaml", base_url="http://api:3000")
         snap_dir = tmp_path / "snapshots"
         snap_dir.mkdir()
@@ -193,7 +174,7 @@ class TestAutoSnapshotWithManualSnapshot:
 
         mock_exec.return_value = make_request_result(body={"ok": True})
 
-        result = runner.invoke(main, ["-t", "health", "--snapshot", "manual"])
+        result = invoke_in(["-t", "health", "--snapshot", "manual"])
         assert result.exit_code == 0
 
         # Both snapshots should exist